@@ -10,18 +10,22 @@ It integrates with a Neo4j database for caching to improve performance.
 Key Design Points:
 - Uses FastAPI for modern, high-performance web APIs.
 - Interacts with a Neo4j database for persistent caching of results.
-- Wraps synchronous functions from `kc_core.py` (which use `requests`)
+- OpenAlex lookups and content enrichment await `kc_core.py`'s async
+  fetchers over one shared `aiohttp` session.
+- The synchronous LLM calls from `kc_core.py` (which use `requests`) run
   in `asyncio.to_thread` to prevent blocking the server's event loop.
-- Uses `aiohttp` only where absolutely necessary for async operations if any.
 - Provides background tasks for caching to return responses to the user faster.
 """
 
 import asyncio
 import logging
 import requests
+import orjson
 from urllib.parse import unquote
 import os
+from typing import Dict, List
 from fastapi import FastAPI, Query, HTTPException, Depends, BackgroundTasks
+from fastapi.responses import StreamingResponse
 from neo4j import AsyncGraphDatabase, AsyncDriver
 from pydantic_settings import BaseSettings
 
@@ -33,8 +37,13 @@ import kc_core as core
 from neo4j_repository import (
     get_author_summary_from_neo4j,
     save_author_summary_to_neo4j,
+    get_author_summaries_batch,
     get_paper_cache_from_neo4j,
-    save_paper_cache_to_neo4j
+    save_paper_cache_to_neo4j,
+    get_paper_summaries_batch,
+    get_paper_contents_batch,
+    save_paper_contents_batch,
+    ensure_indexes
 )
 
 # --- Configuration & Boilerplate ---
@@ -48,11 +57,77 @@ class Settings(BaseSettings):
     NEO4J_USERNAME: str
     NEO4J_PASSWORD: str
     GROQ_API_KEY: str
+    NEO4J_MAX_CONNECTION_POOL_SIZE: int = 256
+    NEO4J_CONNECTION_ACQUISITION_TIMEOUT: float = 30.0
+    SUMMARY_CONCURRENCY: int = 8
+    PROFESSOR_BATCH_LIMIT: int = 10
     class Config:
         env_file = ".env"
 
 settings = Settings()
 db_driver: AsyncDriver = None
+# App-wide aiohttp session for OpenAlex and enrichment sources, so keep-alive
+# connections (and their TLS handshakes) are reused across requests.
+http_session = None
+
+# Response key -> paper key for the `papers_sample` projection. The rows are
+# plain dicts so the response serializes them without a model and the same
+# payload can be cached in Neo4j as-is.
+PAPER_SAMPLE_FIELDS = (
+    ("title", "title"),
+    ("year", "year"),
+    ("citations", "cited_by_count"),
+    ("sources", "content_source"),
+)
+PAPER_SAMPLE_SIZE = 10
+
+def build_papers_sample(papers: list, limit: int = PAPER_SAMPLE_SIZE) -> list:
+    """Projects the first `limit` papers onto the compact sample shape used by the frontend."""
+    return [{key: p.get(src) for key, src in PAPER_SAMPLE_FIELDS} for p in papers[:limit]]
+
+# Author summaries currently being generated, keyed by the requested ID.
+# Concurrent requests for the same author await the first one's result
+# ("single-flight") instead of each missing the cache and repeating the
+# whole OpenAlex/enrichment/LLM fan-out.
+_inflight_summaries: Dict[str, asyncio.Task] = {}
+
+# Cache writes scheduled off the response path. Holding the tasks keeps them
+# from being garbage-collected mid-flight; shutdown waits for the rest.
+_pending_saves: set = set()
+
+def save_in_background(coro) -> asyncio.Task:
+    """Runs a Neo4j save without holding up the response that produced it."""
+    task = asyncio.create_task(coro)
+    _pending_saves.add(task)
+    task.add_done_callback(_pending_saves.discard)
+    return task
+
+# App-wide cap on concurrent LLM summaries (per-paper and author) so bursts
+# of requests do not fan out into Groq rate limits.
+summary_semaphore = asyncio.Semaphore(settings.SUMMARY_CONCURRENCY)
+summaries_in_flight = 0
+
+async def run_paper_summary(paper: dict) -> str:
+    """Runs kc_core's blocking paper summarizer off the event loop, bounded by summary_semaphore."""
+    global summaries_in_flight
+    async with summary_semaphore:
+        summaries_in_flight += 1
+        try:
+            return await asyncio.to_thread(core.generate_paper_summary, paper)
+        finally:
+            summaries_in_flight -= 1
+
+async def run_author_summary(author_info: dict, papers: list, on_token=None) -> str:
+    """Runs kc_core's blocking author summarizer off the event loop, bounded by summary_semaphore."""
+    global summaries_in_flight
+    async with summary_semaphore:
+        summaries_in_flight += 1
+        try:
+            return await asyncio.to_thread(
+                core.generate_author_summary, author_info['display_name'], author_info, papers, on_token
+            )
+        finally:
+            summaries_in_flight -= 1
 
 async def get_neo4j_driver() -> AsyncDriver:
     """Dependency function to get the Neo4j driver instance."""
@@ -61,9 +136,15 @@ async def get_neo4j_driver() -> AsyncDriver:
         raise RuntimeError("Database driver not initialized.")
     return db_driver
 
+def get_http_session():
+    """Returns the shared outbound HTTP session created at startup."""
+    if http_session is None:
+        raise RuntimeError("HTTP session not initialized.")
+    return http_session
+
 app = FastAPI(
     title="Enhanced Author and Paper Summary Service",
-    description="Provides advanced, multi-source summaries for authors and papers with Neo4j caching, powered by kc_core."
+    description="Provides advanced, multi-source summaries for authors and papers with Neo4j caching, powered by kc_core.",
 )
 
 @app.on_event("startup")
@@ -104,33 +185,130 @@ async def startup_event():
     global db_driver
     db_driver = AsyncGraphDatabase.driver(
         settings.NEO4J_URI,
-        auth=(settings.NEO4J_USERNAME, settings.NEO4J_PASSWORD)
+        auth=(settings.NEO4J_USERNAME, settings.NEO4J_PASSWORD),
+        max_connection_pool_size=settings.NEO4J_MAX_CONNECTION_POOL_SIZE,
+        connection_acquisition_timeout=settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
+        keep_alive=True
     )
     await db_driver.verify_connectivity()
     print("Successfully connected to Neo4j.")
+    await ensure_indexes(db_driver)
+
+    global http_session
+    http_session = core.open_http_session()
+    # Open the Groq keep-alive connection in the background so the first
+    # summary request does not pay the TLS handshake
+    asyncio.get_running_loop().run_in_executor(None, core.warm_groq_session)
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Closes the Neo4j database driver on application shutdown."""
+    """Closes the Neo4j driver and the shared HTTP session on application shutdown."""
     global db_driver
+    if _pending_saves:
+        await asyncio.gather(*_pending_saves, return_exceptions=True)
     if db_driver:
         await db_driver.close()
+    if http_session:
+        await http_session.close()
 
 # --- API ENDPOINTS ---
 # In your FastAPI script (main.api.py)
 
+@app.get("/healthz", tags=["Health"])
+async def healthz():
+    """Liveness probe that also reports LLM summary concurrency."""
+    return {
+        "status": "ok",
+        "summary_concurrency": settings.SUMMARY_CONCURRENCY,
+        "summaries_in_flight": summaries_in_flight,
+    }
+
 @app.get("/professors/summary/by-id", tags=["Professors"])
 async def get_professor_summary_by_id(
-    background_tasks: BackgroundTasks,
     id: str = Query(..., description="OpenAlex ID of the author (e.g., A5023888391)"),
     driver: AsyncDriver = Depends(get_neo4j_driver)
 ):
     """
     Generates or retrieves a research summary for a professor by their OpenAlex ID.
     Caches the results in Neo4j for fast subsequent lookups.
+    Concurrent requests for the same ID share a single generation.
     """
-    cached_data = await get_author_summary_from_neo4j(driver, author_id=id)
+    return await asyncio.shield(_shared_summary_build(id, driver))
+
+
+def _shared_summary_build(id: str, driver: AsyncDriver, on_token=None) -> asyncio.Task:
+    """
+    Returns the in-flight author summary build for `id`, starting one if none
+    is running. `on_token` only takes effect when this call starts the build.
+    """
+    task = _inflight_summaries.get(id)
+    if task is None:
+        # The build runs as its own task so no single caller owns it: a
+        # disconnecting client (leader or follower) only stops waiting.
+        task = asyncio.ensure_future(_build_professor_summary(id, driver, on_token))
+        _inflight_summaries[id] = task
+        task.add_done_callback(lambda t: _inflight_summaries.pop(id, None))
+        # Mark a failure retrieved even if every waiter has gone away
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    return task
+
+
+NO_PAPERS_MESSAGE = "Author found, but no papers were available for analysis."
+
+
+async def _collect_author_papers(driver: AsyncDriver, session, author_info: dict) -> list:
+    """Fetches an author's top papers and fills in their content for the author prompt."""
+    raw_papers = await core.fetch_all_openalex_papers_async(
+        author_info['id'], max_papers=20, session=session
+    )
+    if not raw_papers:
+        return []
+
+    # Papers with fresh content from an earlier enrichment, or else a fresh
+    # cached summary standing in as content, skip multi-source enrichment.
+    # Either way they keep the labels of the sources the text came from.
+    paper_ids = [p["openalex_id"] for p in raw_papers if p.get("openalex_id")]
+    cached_summaries, cached_contents = await asyncio.gather(
+        get_paper_summaries_batch(driver, paper_ids),
+        get_paper_contents_batch(driver, paper_ids),
+    )
+    papers_to_enrich = []
+    for p in raw_papers:
+        cached = cached_contents.get(p.get("openalex_id"))
+        if cached is None:
+            cached_summary = cached_summaries.get(p.get("openalex_id"))
+            if cached_summary:
+                cached = {"full_content": cached_summary["summary"],
+                          "content_sources": cached_summary["content_sources"]}
+        if cached:
+            p["full_content"] = cached["full_content"]
+            p["has_fulltext"] = True
+            p["content_sources"] = cached["content_sources"]
+            p["content_source"] = ", ".join(p["content_sources"]) or "None"
+        else:
+            papers_to_enrich.append(p)
+
+    # enrich_papers_with_content fills the same dicts in place, so
+    # raw_papers keeps its citation order with every paper populated.
+    if papers_to_enrich:
+        await core.enrich_papers_with_content(papers_to_enrich, session=session)
+        save_in_background(save_paper_contents_batch(driver, papers_to_enrich))
+    return raw_papers
+
+
+async def _build_professor_summary(id: str, driver: AsyncDriver, on_token=None):
+    """Cache-first author summary generation behind get_professor_summary_by_id."""
+    session = get_http_session()
+    # Start the OpenAlex author lookup alongside the cache read so a miss
+    # costs max(Neo4j, OpenAlex) instead of their sum.
+    author_task = asyncio.create_task(core.fetch_author_by_id_async(session, id))
+    try:
+        cached_data = await get_author_summary_from_neo4j(driver, author_id=id)
+    except BaseException:
+        author_task.cancel()
+        raise
     if cached_data:
+        author_task.cancel()
         return {
             "source": "cache",
             "message": "Summary and data retrieved from Neo4j cache.",
@@ -138,15 +316,13 @@ async def get_professor_summary_by_id(
         }
 
     try:
-        author_info = await asyncio.to_thread(core.fetch_author_by_id, id)
+        author_info = await author_task
         if not author_info:
             raise HTTPException(status_code=404, detail=f"Author with ID '{id}' not found in OpenAlex.")
 
-        raw_papers = await asyncio.to_thread(core.fetch_all_openalex_papers, author_info['id'], max_papers=20)
-        if not raw_papers:
-            return {"author_info": author_info, "summary": "Author found, but no papers were available for analysis."}
-
-        enriched_papers = await core.enrich_papers_with_content(raw_papers)
+        enriched_papers = await _collect_author_papers(driver, session, author_info)
+        if not enriched_papers:
+            return {"author_info": author_info, "summary": NO_PAPERS_MESSAGE}
 
         # ------------------------------------------------------------------- #
         # --- KEY CHANGE: THE INEFFICIENT LOOP FOR PAPER SUMMARIES IS GONE ---
@@ -159,24 +335,17 @@ async def get_professor_summary_by_id(
         # ------------------------------------------------------------------- #
         
         # Generate the main author summary in a thread (This makes ONE API call)
-        author_summary = await asyncio.to_thread(
-            core.generate_author_summary,
-            author_info['display_name'],
-            author_info,
-            enriched_papers
-        )
+        author_summary = await run_author_summary(author_info, enriched_papers, on_token)
 
         response_data = {
             "research_summary": author_summary,
             "papers_analyzed_count": len(enriched_papers),
-            "papers_sample": [{
-                "title": p.get('title'), "year": p.get('year'),
-                "citations": p.get('cited_by_count'), "sources": p.get('content_source')
-            } for p in enriched_papers[:10]]
+            "papers_sample": build_papers_sample(enriched_papers)
         }
 
-        # Cache the complete author response object
-        background_tasks.add_task(save_author_summary_to_neo4j, driver, author_info, response_data)
+        # Cache the complete author response object. Scheduled app-wide rather
+        # than on the request, since the shared build can outlive its caller.
+        save_in_background(save_author_summary_to_neo4j(driver, author_info, response_data))
 
         return {
             "source": "generated",
@@ -190,12 +359,100 @@ async def get_professor_summary_by_id(
              # You can decide what to return here. Maybe a rule-based summary or a specific message.
              return {"author_info": author_info, "summary": "Could not generate summary due to API limits. Please try again later."}
         raise HTTPException(status_code=500, detail=f"An HTTP error occurred: {str(e)}")
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error in get_professor_summary_by_id: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {str(e)}")
     
 
 
+@app.get("/professors/summary/batch", tags=["Professors"])
+async def get_professor_summaries_batch(
+    ids: List[str] = Query(..., description="OpenAlex author IDs; repeat the parameter for each author"),
+    driver: AsyncDriver = Depends(get_neo4j_driver)
+):
+    """
+    Generates or retrieves research summaries for several professors at once.
+    Authors are processed concurrently, so their OpenAlex fetches and LLM calls
+    overlap instead of queueing behind one another. Returns a mapping of ID to
+    the same payload as /professors/summary/by-id, or to an error object.
+    """
+    unique_ids = list(dict.fromkeys(ids))
+    if len(unique_ids) > settings.PROFESSOR_BATCH_LIMIT:
+        raise HTTPException(status_code=400, detail=f"At most {settings.PROFESSOR_BATCH_LIMIT} authors per batch.")
+
+    # One UNWIND read answers every cached author; only misses are generated
+    cached = await get_author_summaries_batch(driver, unique_ids)
+    batch = {
+        author_id: {
+            "source": "cache",
+            "message": "Summary and data retrieved from Neo4j cache.",
+            **cached[author_id]
+        }
+        for author_id in unique_ids if author_id in cached
+    }
+    missing_ids = [author_id for author_id in unique_ids if author_id not in cached]
+    results = await asyncio.gather(
+        *(get_professor_summary_by_id(id=author_id, driver=driver) for author_id in missing_ids),
+        return_exceptions=True
+    )
+    for author_id, result in zip(missing_ids, results):
+        if isinstance(result, HTTPException):
+            batch[author_id] = {"error": result.detail, "status_code": result.status_code}
+        elif isinstance(result, Exception):
+            batch[author_id] = {"error": str(result), "status_code": 500}
+        else:
+            batch[author_id] = result
+    return {author_id: batch[author_id] for author_id in unique_ids}
+
+
+def _ndjson_line(obj: dict) -> bytes:
+    return orjson.dumps(obj) + b"\n"
+
+
+@app.get("/professors/summary/by-id/stream", tags=["Professors"])
+async def stream_professor_summary_by_id(
+    id: str = Query(..., description="OpenAlex ID of the author (e.g., A5023888391)"),
+    driver: AsyncDriver = Depends(get_neo4j_driver)
+):
+    """
+    Streams a professor's research summary as NDJSON while the LLM generates it.
+    Emits `{"token": ...}` lines as text arrives, then one final object with the
+    same shape as /professors/summary/by-id; clients should treat that final
+    object as authoritative. Cache hits, and requests that join a generation
+    already in flight for the same ID, return only the final object.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+
+    def on_token(chunk: str):
+        loop.call_soon_threadsafe(queue.put_nowait, chunk)
+
+    # Shares the single-flight build (and summary_semaphore) with /by-id
+    task = _shared_summary_build(id, driver, on_token)
+    # Scheduled after every token callback, so it marks the end of the stream
+    task.add_done_callback(lambda _: queue.put_nowait(None))
+
+    # Wait for the first token before committing to a streaming response, so
+    # cache hits and errors still come back as a single object or status code
+    first = await queue.get()
+    if first is None:
+        response = await asyncio.shield(task)
+        return StreamingResponse(iter([_ndjson_line(response)]), media_type="application/x-ndjson")
+    return StreamingResponse(_stream_author_summary(queue, first, task), media_type="application/x-ndjson")
+
+
+async def _stream_author_summary(queue: asyncio.Queue, first: str, task: asyncio.Task):
+    """Relays generate_author_summary's token callback from its worker thread to the response."""
+    chunk = first
+    while chunk is not None:
+        yield _ndjson_line({"token": chunk})
+        chunk = await queue.get()
+    # The build schedules its own cache write; a disconnect here leaves it running
+    yield _ndjson_line(await asyncio.shield(task))
+
+
 @app.get("/paper/by-id", tags=["Papers"])
 async def get_paper_summary_by_id(
     background_tasks: BackgroundTasks,
@@ -216,11 +473,9 @@ async def get_paper_summary_by_id(
         return {"source": "cache", **cached_response}
 
     try:
-        # kc_core.py does not have a fetch_paper_by_id, so we do it here
-        # using `requests` in a thread for consistency.
-        
-
-        raw_paper_data = await asyncio.to_thread(core.fetch_paper_by_id, search_id_full)
+        # Fetched on the shared aiohttp session, so no threadpool slot is held
+        # while waiting on OpenAlex
+        raw_paper_data = await core.fetch_paper_by_id_async(get_http_session(), search_id_full)
         if not raw_paper_data:
              raise HTTPException(status_code=404, detail=f"Paper with ID '{search_id_full}' not found.")
 
@@ -235,12 +490,12 @@ async def get_paper_summary_by_id(
             "openalex_id": raw_paper_data.get("id")
         }
 
-        enriched_papers = await core.enrich_papers_with_content([paper_info])
+        enriched_papers = await core.enrich_papers_with_content([paper_info], session=get_http_session())
         if not enriched_papers:
             raise HTTPException(status_code=500, detail="Failed to enrich paper content.")
         enriched_paper = enriched_papers[0]
 
-        summary = core.generate_paper_summary(enriched_paper)
+        summary = await run_paper_summary(enriched_paper)
         paper_to_cache = enriched_paper.copy()
         paper_to_cache.pop("full_content", None)
 
@@ -264,17 +519,10 @@ async def get_paper_summary_by_title(
     decoded_title = unquote(title)
 
     try:
-        # Use kc_core's synchronous fetch_author_candidates, but for works
-        def search_paper_sync(search_title):
-            url = f"https://api.openalex.org/works?search={search_title}&per-page=1"
-            r = requests.get(url)
-            r.raise_for_status()
-            return r.json()
-
-        data = await asyncio.to_thread(search_paper_sync, decoded_title)
-        if not data or not data.get("results"):
+        results = await core.search_works_async(get_http_session(), decoded_title)
+        if not results:
             raise HTTPException(status_code=404, detail=f"Paper with title '{decoded_title}' not found.")
-        raw_paper = data["results"][0]
+        raw_paper = results[0]
 
         # Map the data
         paper_info = {
@@ -287,12 +535,12 @@ async def get_paper_summary_by_title(
             "openalex_id": raw_paper.get("id")
         }
 
-        enriched_papers = await core.enrich_papers_with_content([paper_info])
+        enriched_papers = await core.enrich_papers_with_content([paper_info], session=get_http_session())
         if not enriched_papers:
              raise HTTPException(status_code=500, detail="Failed to enrich paper content.")
         enriched_paper = enriched_papers[0]
 
-        summary = core.generate_paper_summary(enriched_paper)
+        summary = await run_paper_summary(enriched_paper)
         enriched_paper.pop("full_content", None)
 
         return {"paper_info": enriched_paper, "summary": summary}
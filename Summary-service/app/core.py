@@ -2,35 +2,77 @@ import asyncio
 import aiohttp
 import re
 import os
-import json
-from typing import List, Dict, Optional, Tuple, Set, Counter
-import hashlib
+import random
+import orjson
+import xxhash
+from typing import List, Dict, Optional, Tuple, Set
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import heapq
+import io
 import xml.etree.ElementTree as ET
-
-# --- PDF Processing Dependencies (Optional) ---
-try:
-    import PyPDF2
-    import pdfplumber
-    import io
-except ImportError:
-    PyPDF2 = None
-    pdfplumber = None
-    io = None
-    print("WARNING: PDF libraries not found. Run 'pip install PyPDF2 pdfplumber' for full PDF text extraction.")
+from urllib.parse import urlsplit
 
 # --- Configuration ---
 GROQ_API_KEY = os.environ.get("GROQ_API_KEY")
 GROQ_MODEL = os.environ.get("GROQ_MODEL", "llama-3.3-70b-versatile")
 MAILTO_EMAIL = os.environ.get("MAILTO_EMAIL", "hello@example.com")
+# Long full texts are summarized tile-by-tile, then the tile notes are combined.
+SUMMARY_TILE_CHARS = int(os.environ.get("SUMMARY_TILE_CHARS", "4000"))
+SUMMARY_MAX_TILES = int(os.environ.get("SUMMARY_MAX_TILES", "8"))
+TILE_CACHE_SIZE = 2048
+# Completed Groq responses kept in-process, keyed by a hash of model, token
+# limit and prompt, so a repeated prompt (same paper or author) skips the call
+GROQ_CACHE_SIZE = 512
+# Paper content in the author prompt shares one character budget, and papers
+# without any content are dropped when enough others remain.
+AUTHOR_SUMMARY_CONTENT_BUDGET = int(os.environ.get("AUTHOR_SUMMARY_CONTENT_BUDGET", "12000"))
+AUTHOR_SUMMARY_MIN_PAPERS = 8
+# Shortest content a paper summary is generated from; a paper whose OpenAlex
+# abstract already meets it and has no DOI/arXiv id skips enrichment
+PAPER_SUMMARY_MIN_CHARS = 100
+# Connection pool for the shared session: keep-alive sockets and cached DNS
+# answers are reused across the bursts of OpenAlex/Semantic Scholar/Groq calls
+HTTP_CONNECTION_LIMIT = int(os.environ.get("HTTP_CONNECTION_LIMIT", "128"))
+HTTP_CONNECTION_LIMIT_PER_HOST = 32
+PDF_DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=30)
+GROQ_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=120)
+# PDFs above this size are skipped instead of being read into memory whole
+MAX_PDF_BYTES = int(os.environ.get("MAX_PDF_MB", "25")) * 1024 * 1024
+# In-flight caps for _fetch_json: one across all hosts, one per host (tighter
+# for Semantic Scholar, which throttles bursts). Throttled and 5xx responses
+# are retried, honoring Retry-After (capped) or else backing off exponentially.
+FETCH_MAX_CONCURRENT = 64
+FETCH_MAX_CONCURRENT_PER_HOST = 8
+HOST_MAX_CONCURRENT = {"api.semanticscholar.org": 5}
+FETCH_MAX_RETRIES = 3
+FETCH_MAX_RETRY_WAIT = 30.0
+# Open-access PDF downloads in flight at once, and the deadline for all of a
+# paper's sources (PDF download plus extraction included)
+PDF_MAX_CONCURRENT_DOWNLOADS = 4
+ENRICH_PAPER_TIMEOUT = float(os.environ.get("ENRICH_PAPER_TIMEOUT", "20"))
+# Semantic Scholar's /paper/batch accepts up to 500 IDs per request
+SEMANTIC_BATCH_SIZE = 500
 
 # --- Advanced Helper Functions (from script 2) ---
+# Tags are bounded in length so a stray "<" in PDF text can't make every
+# later "<" rescan the rest of the document
+_TAG_RE = re.compile(r"<[^>]{1,4096}>")
+_COPYRIGHT_LINE_RE = re.compile(r"(?im)^.*copyright.*$")
+_RIGHTS_RESERVED_LINE_RE = re.compile(r"(?im)^.*all rights reserved.*$")
+_WS_RE = re.compile(r"\s+")
+_ARXIV_ABS_RE = re.compile(r"arxiv\.org/abs/(\S+)")
+
 def sanitize_text(text: Optional[str]) -> str:
     if not text: return ""
     text = str(text)
-    text = re.sub(r"<[^>]+>", " ", text)
-    text = re.sub(r"(?im)^.*copyright.*$", " ", text)
-    text = re.sub(r"(?im)^.*all rights reserved.*$", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _TAG_RE.sub(" ", text)
+    # The footer-line regexes scan every line; skip them when no footer is present
+    lowered = text.lower()
+    if "copyright" in lowered: text = _COPYRIGHT_LINE_RE.sub(" ", text)
+    if "all rights reserved" in lowered: text = _RIGHTS_RESERVED_LINE_RE.sub(" ", text)
+    text = _WS_RE.sub(" ", text).strip()
     return text
 
 def trim_to_last_sentence(text: str) -> str:
@@ -42,71 +84,233 @@ def trim_to_last_sentence(text: str) -> str:
 
 def normalize_text(text: str) -> str:
     if not text: return ""
-    return re.sub(r'\s+', ' ', text.strip()).lower()
-
-def get_text_hash(text: str) -> str:
-    return hashlib.md5(normalize_text(text).encode()).hexdigest()
+    return _WS_RE.sub(' ', text.strip()).lower()
+
+def get_text_hash(text: str) -> int:
+    # Identity check only, so a fast 64-bit xxh3 fingerprint replaces MD5
+    return xxhash.xxh3_64_intdigest(normalize_text(text).encode())
+
+def _prepare_for_dedup(text: str, sanitized: bool = False) -> Tuple[str, int, frozenset]:
+    """Normalize, hash and (for long texts) tokenize once per content item.
+    Output of sanitize_text is already whitespace-collapsed, so `sanitized`
+    text only needs lowercasing."""
+    norm = text.lower() if sanitized else normalize_text(text)
+    tokens = frozenset(norm.split()) if len(norm) > 100 else frozenset()
+    return norm, xxhash.xxh3_64_intdigest(norm.encode()), tokens
+
+def _is_duplicate_prepared(prepared1: Tuple[str, int, frozenset], prepared2: Tuple[str, int, frozenset],
+                           threshold: float = 0.9) -> bool:
+    norm1, hash1, tokens1 = prepared1
+    norm2, hash2, tokens2 = prepared2
+    if hash1 == hash2: return True
+    if len(norm1) < 200 and len(norm2) < 200: return norm1 == norm2
+    # Only the shorter text can be contained in the longer one
+    shorter, longer = (norm1, norm2) if len(norm1) <= len(norm2) else (norm2, norm1)
+    if shorter in longer: return True
+    if tokens1 and tokens2:
+        # Jaccard is bounded by the size ratio of the sets; skip the intersection when it can't pass
+        if min(len(tokens1), len(tokens2)) <= threshold * max(len(tokens1), len(tokens2)): return False
+        common = len(tokens1 & tokens2)
+        return common / (len(tokens1) + len(tokens2) - common) > threshold
+    return False
 
 def is_duplicate(text1: str, text2: str, threshold: float = 0.9) -> bool:
     if not text1 or not text2: return False
-    if get_text_hash(text1) == get_text_hash(text2): return True
-    norm1, norm2 = normalize_text(text1), normalize_text(text2)
-    if len(norm1) < 200 and len(norm2) < 200: return norm1 == norm2
-    if norm1 in norm2 or norm2 in norm1: return True
-    if len(norm1) > 100 and len(norm2) > 100:
-        common_words = set(norm1.split()) & set(norm2.split())
-        total_words = set(norm1.split()) | set(norm2.split())
-        if total_words:
-            return (len(common_words) / len(total_words)) > threshold
-    return False
+    return _is_duplicate_prepared(_prepare_for_dedup(text1), _prepare_for_dedup(text2), threshold)
 
-def deduplicate_content(content_list: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+def deduplicate_content(content_list: List[Tuple[str, str]], sanitized: bool = False) -> List[Tuple[str, str]]:
     unique_content: List[Tuple[str, str]] = []
+    unique_prepared: List[Tuple[str, int, frozenset]] = []
+    seen_hashes: Set[int] = set()
     if not content_list: return []
     for content, source in content_list:
         if not content or not content.strip(): continue
-        is_dup = any(is_duplicate(content, existing_content) for existing_content, _ in unique_content)
-        if not is_dup:
-            unique_content.append((content, source))
+        # Each item is normalized and hashed once, not once per comparison
+        prepared = _prepare_for_dedup(content, sanitized)
+        if prepared[1] in seen_hashes: continue
+        if any(_is_duplicate_prepared(prepared, existing) for existing in unique_prepared): continue
+        unique_content.append((content, source))
+        unique_prepared.append(prepared)
+        seen_hashes.add(prepared[1])
     return unique_content
 
 
 # --- PDF Extraction ---
-def extract_text_from_pdf(pdf_data: bytes) -> Optional[str]:
-    if not pdfplumber or not PyPDF2 or not io: return None
+# Pages the first-pass reader returns empty are retried with pdfplumber once
+# they exceed this share of the document; PDF_PLUMBER_FALLBACK=0 turns that
+# slow pdfminer pass off entirely
+PDF_EMPTY_PAGE_RATIO = 0.3
+PDF_PLUMBER_FALLBACK = os.environ.get("PDF_PLUMBER_FALLBACK", "1") == "1"
+
+def _read_pages_pdfium(pdf_data: bytes) -> List[str]:
+    import pypdfium2 as pdfium
+    pdf = pdfium.PdfDocument(pdf_data)
+    pages: List[str] = []
     try:
-        with io.BytesIO(pdf_data) as pdf_stream:
-            with pdfplumber.open(pdf_stream) as pdf:
-                return "\n".join(page.extract_text() for page in pdf.pages if page.extract_text())
-    except Exception:
+        for page in pdf:
+            try:
+                textpage = page.get_textpage()
+                pages.append(textpage.get_text_range() or "")
+                textpage.close()
+            except Exception:
+                pages.append("")
+            finally:
+                page.close()
+    finally:
+        pdf.close()
+    return pages
+
+def _read_pages_pypdf2(pdf_data: bytes) -> List[str]:
+    import PyPDF2
+    pages: List[str] = []
+    for page in PyPDF2.PdfReader(io.BytesIO(pdf_data)).pages:
         try:
-            with io.BytesIO(pdf_data) as pdf_stream:
-                reader = PyPDF2.PdfReader(pdf_stream)
-                return "\n".join(page.extract_text() for page in reader.pages if page.extract_text())
+            pages.append(page.extract_text() or "")
         except Exception:
-            return None
-    return None
+            pages.append("")
+    return pages
+
+def extract_text_from_pdf(pdf_data: bytes) -> Optional[str]:
+    # PDFium (C++) reads every page first, with PyPDF2 standing in when it is
+    # missing or fails; pdfplumber (pdfminer) re-parses only the pages left
+    # empty, instead of the whole document after a late failure. Parsers are
+    # imported on first use so importing this module stays cheap.
+    pages: List[str] = []
+    for read_pages in (_read_pages_pdfium, _read_pages_pypdf2):
+        try:
+            pages = read_pages(pdf_data)
+        except Exception:
+            pages = []
+        if any(text.strip() for text in pages):
+            break
+
+    empty = [i for i, text in enumerate(pages) if not text.strip()]
+    if PDF_PLUMBER_FALLBACK and (not pages or len(empty) > PDF_EMPTY_PAGE_RATIO * len(pages)):
+        try:
+            import pdfplumber
+            with pdfplumber.open(io.BytesIO(pdf_data)) as pdf:
+                if not pages:
+                    pages = [""] * len(pdf.pages)
+                    empty = range(len(pages))
+                for i in empty:
+                    pages[i] = pdf.pages[i].extract_text() or ""
+        except Exception:
+            pass
+
+    text = "\n".join(text for text in pages if text)
+    return text or None
+
+# PDF parsing is CPU-bound and holds the GIL, so it runs in a process pool
+# (created on first use) while the event loop keeps downloading. Workers come
+# from a forkserver/spawn context, since forking a multi-threaded process can
+# deadlock the child on a lock another thread held.
+PDF_WORKERS = int(os.environ.get("PDF_WORKERS", os.cpu_count() or 2))
+_PDF_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn")
+_pdf_executor: Optional[ProcessPoolExecutor] = None
+
+def get_pdf_executor() -> ProcessPoolExecutor:
+    global _pdf_executor
+    if _pdf_executor is None:
+        _pdf_executor = ProcessPoolExecutor(max_workers=PDF_WORKERS, mp_context=_PDF_MP_CONTEXT)
+    return _pdf_executor
+
+async def extract_text_from_pdf_async(pdf_data: bytes) -> Optional[str]:
+    return await asyncio.get_running_loop().run_in_executor(get_pdf_executor(), extract_text_from_pdf, pdf_data)
 
 # --- Asynchronous Data Fetching Layer (Expanded) ---
+def create_http_session() -> aiohttp.ClientSession:
+    """Create the pooled session every fetcher here expects; open one per
+    service lifetime and pass it through instead of one per request."""
+    connector = aiohttp.TCPConnector(limit=HTTP_CONNECTION_LIMIT, limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST,
+                                     ttl_dns_cache=300, keepalive_timeout=75)
+    return aiohttp.ClientSession(connector=connector)
+
+# One pooled session per event loop, for callers that don't manage their own
+_shared_sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+def get_session() -> aiohttp.ClientSession:
+    """Return this loop's shared session, creating it on first use; pair with
+    close_session() on shutdown."""
+    loop = asyncio.get_running_loop()
+    session = _shared_sessions.get(loop)
+    if session is None or session.closed:
+        session = _shared_sessions[loop] = create_http_session()
+    return session
+
+async def close_session() -> None:
+    session = _shared_sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
+_fetch_semaphores: Dict[Tuple[asyncio.AbstractEventLoop, Optional[str]], asyncio.Semaphore] = {}
+
+def _fetch_semaphore(host: Optional[str], limit: Optional[int] = None) -> asyncio.Semaphore:
+    """Per-event-loop semaphore for `host` (None for the global cap); `limit`
+    overrides the configured cap for other named pools."""
+    loop = asyncio.get_running_loop()
+    semaphore = _fetch_semaphores.get((loop, host))
+    if semaphore is None:
+        for key in [k for k in _fetch_semaphores if k[0].is_closed()]:
+            del _fetch_semaphores[key]
+        if limit is None:
+            limit = FETCH_MAX_CONCURRENT if host is None else HOST_MAX_CONCURRENT.get(host, FETCH_MAX_CONCURRENT_PER_HOST)
+        semaphore = _fetch_semaphores[(loop, host)] = asyncio.Semaphore(limit)
+    return semaphore
+
 async def _fetch_json(session: aiohttp.ClientSession, url: str, params: Optional[Dict] = None) -> Optional[Dict]:
+    host = urlsplit(url).hostname
+    for attempt in range(FETCH_MAX_RETRIES):
+        retry_after = None
+        try:
+            async with _fetch_semaphore(None), _fetch_semaphore(host):
+                async with session.get(url, params=params) as resp:
+                    if resp.status == 429 or resp.status >= 500:
+                        retry_after = resp.headers.get("Retry-After")
+                    else:
+                        resp.raise_for_status()
+                        return orjson.loads(await resp.read())
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            pass
+        except Exception:
+            return None
+        if attempt == FETCH_MAX_RETRIES - 1:
+            break
+        try:
+            wait_time = min(float(retry_after), FETCH_MAX_RETRY_WAIT)
+        except (TypeError, ValueError):
+            wait_time = 2 ** attempt + random.random()
+        # Back off outside the semaphores so other requests keep the slots busy
+        await asyncio.sleep(wait_time)
+    return None
+
+async def _read_pdf_body(resp: aiohttp.ClientResponse) -> Optional[bytes]:
+    """Stream a PDF body in chunks, returning None once it exceeds MAX_PDF_BYTES."""
+    if resp.content_length and resp.content_length > MAX_PDF_BYTES: return None
+    body = bytearray()
+    async for chunk in resp.content.iter_chunked(65536):
+        body.extend(chunk)
+        if len(body) > MAX_PDF_BYTES: return None
+    return bytes(body)
+
+async def _download_pdf(session: aiohttp.ClientSession, pdf_url: str) -> Optional[bytes]:
+    """Downloads a PDF, holding one of PDF_MAX_CONCURRENT_DOWNLOADS slots while it streams."""
     try:
-        async with session.get(url, params=params) as resp:
-            resp.raise_for_status()
-            return await resp.json()
-    except Exception:
-        return None
+        async with _fetch_semaphore("pdf", PDF_MAX_CONCURRENT_DOWNLOADS):
+            async with session.get(pdf_url, timeout=PDF_DOWNLOAD_TIMEOUT) as pdf_resp:
+                if pdf_resp.status == 200:
+                    return await _read_pdf_body(pdf_resp)
+    # Only network failures mean "no PDF"; anything else is a bug and surfaces
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        pass
+    return None
 
 async def fetch_unpaywall_text(session: aiohttp.ClientSession, doi: str) -> Optional[str]:
     if not doi: return None
     data = await _fetch_json(session, f"https://api.unpaywall.org/v2/{doi}", params={"email": MAILTO_EMAIL})
     if data and data.get("best_oa_location") and data["best_oa_location"].get("url_for_pdf"):
-        pdf_url = data["best_oa_location"]["url_for_pdf"]
-        try:
-            async with session.get(pdf_url, timeout=30) as pdf_resp:
-                if pdf_resp.status == 200:
-                    return extract_text_from_pdf(await pdf_resp.read())
-        except Exception:
-            return None
+        pdf_data = await _download_pdf(session, data["best_oa_location"]["url_for_pdf"])
+        return await extract_text_from_pdf_async(pdf_data) if pdf_data else None
     return None
 
 async def fetch_semantic_scholar_data(session: aiohttp.ClientSession, title: str) -> Optional[Dict]:
@@ -114,6 +318,26 @@ async def fetch_semantic_scholar_data(session: aiohttp.ClientSession, title: str
     data = await _fetch_json(session, "https://api.semanticscholar.org/graph/v1/paper/search", params)
     return data.get("data", [None])[0] if data else None
 
+async def fetch_semantic_scholar_batch(session: aiohttp.ClientSession, dois: List[str]) -> Dict[str, Dict]:
+    """Looks up many papers by DOI with one POST per SEMANTIC_BATCH_SIZE IDs; returns {doi.lower(): record}."""
+    results: Dict[str, Dict] = {}
+    url = "https://api.semanticscholar.org/graph/v1/paper/batch"
+    for start in range(0, len(dois), SEMANTIC_BATCH_SIZE):
+        chunk = dois[start:start + SEMANTIC_BATCH_SIZE]
+        try:
+            async with _fetch_semaphore(None), _fetch_semaphore("api.semanticscholar.org"):
+                async with session.post(url, params={"fields": "abstract,tldr"},
+                                        data=orjson.dumps({"ids": [f"DOI:{doi}" for doi in chunk]}),
+                                        headers={"Content-Type": "application/json"}) as resp:
+                    if resp.status != 200: continue
+                    data = orjson.loads(await resp.read())
+        except Exception:
+            continue
+        # Records come back in request order, with null for unknown IDs
+        for doi, record in zip(chunk, data):
+            if record: results[doi.lower()] = record
+    return results
+
 async def fetch_crossref_data(session: aiohttp.ClientSession, doi: str) -> Optional[Dict]:
     if not doi: return None
     data = await _fetch_json(session, f"https://api.crossref.org/works/{doi}")
@@ -121,27 +345,38 @@ async def fetch_crossref_data(session: aiohttp.ClientSession, doi: str) -> Optio
         return {"abstract": data["message"].get("abstract", "")}
     return None
 
+# lxml's C parser when available, stdlib otherwise
+try:
+    from lxml.etree import iterparse as xml_iterparse
+except ImportError:
+    xml_iterparse = ET.iterparse
+
+ATOM_ENTRY = "{http://www.w3.org/2005/Atom}entry"
+ATOM_SUMMARY = "{http://www.w3.org/2005/Atom}summary"
+
+def extract_arxiv_summary(xml_data: bytes) -> Optional[str]:
+    """Stream-parse an arXiv Atom response and stop at the first entry's summary."""
+    in_entry = False
+    for event, elem in xml_iterparse(io.BytesIO(xml_data), events=("start", "end")):
+        if elem.tag == ATOM_ENTRY:
+            in_entry = event == "start"
+        elif in_entry and event == "end" and elem.tag == ATOM_SUMMARY:
+            return elem.text.strip() if elem.text else None
+    return None
+
 async def fetch_arxiv_fulltext(session: aiohttp.ClientSession, arxiv_id: str) -> Optional[str]:
     if not arxiv_id: return None
-    pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
-    try:
-        async with session.get(pdf_url) as pdf_resp:
-            if pdf_resp.status == 200:
-                pdf_data = await pdf_resp.read()
-                return extract_text_from_pdf(pdf_data)
-    except Exception:
-        pass # Fallback to abstract if PDF fails
+    pdf_data = await _download_pdf(session, f"https://arxiv.org/pdf/{arxiv_id}.pdf")
+    if pdf_data:
+        text = await extract_text_from_pdf_async(pdf_data)
+        if text: return text
+    # Fallback to abstract if PDF fails
     
     try:
         abs_url = f"http://export.arxiv.org/api/query?id_list={arxiv_id}"
         async with session.get(abs_url) as resp:
             if resp.status == 200:
-                xml_content = await resp.text()
-                root = ET.fromstring(xml_content)
-                entry = root.find('{http://www.w3.org/2005/Atom}entry')
-                if entry:
-                    summary = entry.find('{http://www.w3.org/2005/Atom}summary')
-                    if summary is not None: return summary.text.strip()
+                return extract_arxiv_summary(await resp.read())
     except Exception:
         return None
     return None
@@ -174,16 +409,31 @@ async def fetch_author_by_id(session: aiohttp.ClientSession, id: str) -> Optiona
     params = {"mailto": MAILTO_EMAIL}
     return await _fetch_json(session, f"https://api.openalex.org/{url}", params)
 # --- Core Logic: Enrichment and Summarization ---
+def decode_inverted_abstract(inv_abstract: Dict[str, List[int]]) -> str:
+    """Rebuilds abstract text from OpenAlex's {word: [positions]} index.
+
+    Positions are normally dense, so the slot count is the total position
+    count and no separate max() pass is needed; sparse indexes fall back to
+    sorting (position, word) pairs.
+    """
+    n = sum(map(len, inv_abstract.values()))
+    words = [None] * n
+    try:
+        for word, positions in inv_abstract.items():
+            for pos in positions: words[pos] = word
+    except IndexError:
+        pairs = sorted((pos, word) for word, positions in inv_abstract.items() for pos in positions)
+        return " ".join(word for _, word in pairs)
+    if None in words:
+        return " ".join(word for word in words if word is not None)
+    return " ".join(words)
+
 def process_paper_data(paper_data: Dict) -> Dict:
     abstract = ""
     inv_abstract = paper_data.get("abstract_inverted_index")
     if inv_abstract:
         try:
-            max_pos = max(max(pos) for pos in inv_abstract.values())
-            words = [""] * (max_pos + 1)
-            for word, positions in inv_abstract.items():
-                for pos in positions: words[pos] = word
-            abstract = " ".join(words)
+            abstract = decode_inverted_abstract(inv_abstract)
         except (ValueError, TypeError):
             abstract = "Abstract not available."
     
@@ -194,7 +444,7 @@ def process_paper_data(paper_data: Dict) -> Dict:
     paper_data["doi"] = ids.get("doi", "").replace("https://doi.org/", "")
     arxiv_url = ids.get("arxiv")
     if arxiv_url:
-        match = re.search(r'arxiv\.org/abs/(\S+)', arxiv_url)
+        match = _ARXIV_ABS_RE.search(arxiv_url)
         paper_data["arxiv_id"] = match.group(1) if match else None
     else:
         paper_data["arxiv_id"] = None
@@ -213,7 +463,10 @@ def process_paper_data(paper_data: Dict) -> Dict:
 
     return paper_data
 
-async def enrich_paper_with_full_text(session: aiohttp.ClientSession, paper: Dict) -> Dict:
+async def enrich_paper_with_full_text(session: aiohttp.ClientSession, paper: Dict,
+                                      ss_batch: Optional[Dict[str, Dict]] = None) -> Dict:
+    """Gathers every content source for one paper. A Semantic Scholar record
+    prefetched in `ss_batch` (keyed by lowercased DOI) replaces the title search."""
     content_sources: List[Tuple[str, str]] = []
     
     if paper.get("abstract"):
@@ -222,59 +475,106 @@ async def enrich_paper_with_full_text(session: aiohttp.ClientSession, paper: Dic
     doi = paper.get("doi")
     title = paper.get("title", "")
     arxiv_id = paper.get("arxiv_id")
+    ss_data = ss_batch.get(doi.lower()) if ss_batch and doi else None
+    # Without a DOI or arXiv id the only remaining source is a Semantic Scholar
+    # title search for another abstract, which is not worth a round trip
+    # when the OpenAlex one is already long enough to summarize
+    if not doi and not arxiv_id and ss_data is None and len(paper.get("abstract") or "") >= PAPER_SUMMARY_MIN_CHARS:
+        paper["full_content"] = sanitize_text(paper["abstract"])
+        paper["content_sources"] = ["OpenAlex"]
+        return paper
     
-    tasks = [
-        fetch_unpaywall_text(session, doi),
-        fetch_semantic_scholar_data(session, title),
-        fetch_crossref_data(session, doi),
-        fetch_arxiv_fulltext(session, arxiv_id)
-    ]
-    results = await asyncio.gather(*tasks)
+    # Only sources with an identifier to look up get a task
+    tasks: Dict[str, asyncio.Future] = {}
+    if doi:
+        tasks["unpaywall"] = asyncio.ensure_future(fetch_unpaywall_text(session, doi))
+        tasks["crossref"] = asyncio.ensure_future(fetch_crossref_data(session, doi))
+    if arxiv_id:
+        tasks["arxiv"] = asyncio.ensure_future(fetch_arxiv_fulltext(session, arxiv_id))
+    if ss_data is None:
+        tasks["semantic"] = asyncio.ensure_future(fetch_semantic_scholar_data(session, title))
+    # A slow PDF host must not hold back sources that already answered: after
+    # the deadline, unfinished fetches are cancelled and count as missing
+    done, pending = await asyncio.wait(tasks.values(), timeout=ENRICH_PAPER_TIMEOUT) if tasks else (set(), set())
+    for task in pending:
+        task.cancel()
+    results = {name: task.result() if task in done and not task.exception() else None for name, task in tasks.items()}
     
-    unpaywall_text, ss_data, crossref_data, arxiv_text = results
+    unpaywall_text = results.get("unpaywall")
+    crossref_data = results.get("crossref")
+    arxiv_text = results.get("arxiv")
+    if ss_data is None:
+        ss_data = results.get("semantic")
     
     if unpaywall_text: content_sources.append((unpaywall_text, "Unpaywall PDF"))
     if ss_data and ss_data.get("abstract"): content_sources.append((ss_data["abstract"], "Semantic Scholar"))
     if crossref_data and crossref_data.get("abstract"): content_sources.append((crossref_data["abstract"], "Crossref"))
     if arxiv_text: content_sources.append((arxiv_text, "arXiv"))
 
-    unique_content = deduplicate_content(content_sources)
-    paper["full_content"] = "\n\n---\n\n".join(sanitize_text(c[0]) for c in unique_content)
+    # Sanitize each source once up front; dedup and the joined output both
+    # reuse that text instead of re-running the regexes per stage
+    content_sources = [(sanitize_text(text), source) for text, source in content_sources]
+    unique_content = deduplicate_content(content_sources, sanitized=True)
+    paper["full_content"] = "\n\n---\n\n".join(c[0] for c in unique_content)
     paper["content_sources"] = [c[1] for c in unique_content]
     
     return paper
 
+async def enrich_papers_with_full_text(session: aiohttp.ClientSession, papers: List[Dict]) -> List[Dict]:
+    """Enriches papers concurrently after one Semantic Scholar batch lookup for all their DOIs."""
+    dois = [p["doi"] for p in papers if p.get("doi")]
+    ss_batch = await fetch_semantic_scholar_batch(session, dois) if dois else {}
+    return await asyncio.gather(*(enrich_paper_with_full_text(session, p, ss_batch) for p in papers))
+
+_groq_response_cache: "OrderedDict[str, str]" = OrderedDict()
+
 async def generate_with_groq(session: aiohttp.ClientSession, prompt: str, max_tokens: int) -> Optional[str]:
     if not GROQ_API_KEY:
         print("Warning: GROQ_API_KEY not set. LLM summarization is disabled.")
         return None
 
+    cache_key = xxhash.xxh3_128_hexdigest(f"{GROQ_MODEL}\x00{max_tokens}\x00{prompt}".encode())
+    if cache_key in _groq_response_cache:
+        _groq_response_cache.move_to_end(cache_key)
+        return _groq_response_cache[cache_key]
+
     url = "https://api.groq.com/openai/v1/chat/completions"
     payload = {"model": GROQ_MODEL, "messages": [{"role": "user", "content": prompt}], "max_tokens": max_tokens}
     headers = {"Authorization": f"Bearer {GROQ_API_KEY}", "Content-Type": "application/json"}
 
     try:
-        async with session.post(url, headers=headers, json=payload, timeout=120) as resp:
+        async with session.post(url, headers=headers, data=orjson.dumps(payload), timeout=GROQ_REQUEST_TIMEOUT) as resp:
             resp.raise_for_status()
-            data = await resp.json()
-            return data.get("choices", [{}])[0].get("message", {}).get("content")
+            data = orjson.loads(await resp.read())
+            content = data.get("choices", [{}])[0].get("message", {}).get("content")
     except Exception:
         return None
+    if content:
+        _groq_response_cache[cache_key] = content
+        if len(_groq_response_cache) > GROQ_CACHE_SIZE:
+            _groq_response_cache.popitem(last=False)
+    return content
+
+_WORD_RE = re.compile(r"\b[a-zA-Z]{5,}\b")
+_STOPWORDS = frozenset({"based", "using", "paper", "approach", "method", "system", "research", "study", "results", "propose", "present", "provide", "model", "models"})
 
 def rule_based_summary(author_name: str, papers: List[Dict]) -> str:
     """Generate a rule-based summary as a fallback."""
     if not papers: return f"No papers were available to generate a summary for {author_name}."
     
-    all_text = " ".join([p.get("full_content", p.get("abstract", "")) for p in papers])
-    words = re.findall(r"\b[a-zA-Z]{5,}\b", all_text.lower())
-    
-    stopwords = {"based", "using", "paper", "approach", "method", "system", "research", "study", "results", "propose", "present", "provide", "model", "models"}
-    
-    counter = Counter(w for w in words if w not in stopwords)
+    # One pass over the papers tallies words and citations together, without
+    # joining every text into one large string first
+    counter = Counter()
+    total_citations = 0
+    for p in papers:
+        counter.update(_WORD_RE.findall((p.get("full_content") or p.get("abstract") or "").lower()))
+        total_citations += p.get("cited_by_count", 0)
+    # Drop stopwords once from the tally instead of testing every occurrence;
+    # most_common(n) is already a heapq.nlargest partial sort
+    for word in _STOPWORDS:
+        counter.pop(word, None)
     keywords = [w for w, _ in counter.most_common(10)]
     
-    total_citations = sum(p.get("cited_by_count", 0) for p in papers)
-    
     summary = (
         f"A rule-based analysis of the work by {author_name} indicates a focus on several key areas. "
         f"Across {len(papers)} analyzed publications, which have collectively received {total_citations} citations, "
@@ -282,11 +582,71 @@ def rule_based_summary(author_name: str, papers: List[Dict]) -> str:
     )
     return summary
         
+# --- Tiled Summarization for Long Full Texts ---
+_tile_summary_cache: "OrderedDict[int, str]" = OrderedDict()
+
+def split_into_tiles(text: str, max_chars: int = SUMMARY_TILE_CHARS) -> List[str]:
+    """Splits text into chunks of at most max_chars, breaking on sentence boundaries where possible."""
+    tiles: List[str] = []
+    current = ""
+    for sentence in re.split(r"(?<=[.!?])\s+", text):
+        while len(sentence) > max_chars:
+            if current:
+                tiles.append(current)
+                current = ""
+            tiles.append(sentence[:max_chars])
+            sentence = sentence[max_chars:]
+        if current and len(current) + len(sentence) + 1 > max_chars:
+            tiles.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current.strip():
+        tiles.append(current)
+    return tiles
+
+async def summarize_tile(session: aiohttp.ClientSession, title: str, tile: str) -> Optional[str]:
+    """Condenses one tile of a paper into notes; cached by tile content so shared papers are reused."""
+    key = get_text_hash(tile)
+    if key in _tile_summary_cache:
+        _tile_summary_cache.move_to_end(key)
+        return _tile_summary_cache[key]
+
+    prompt = f"""
+    Extract the key points (problem, method, results, numbers) from this excerpt of the paper "{title}".
+    Reply with concise notes only.
+
+    Excerpt:
+    {tile}
+    """
+    notes = await generate_with_groq(session, prompt, max_tokens=300)
+    if not notes or not notes.strip():
+        return None
+    notes = sanitize_text(notes)
+    _tile_summary_cache[key] = notes
+    if len(_tile_summary_cache) > TILE_CACHE_SIZE:
+        _tile_summary_cache.popitem(last=False)
+    return notes
+
+async def condense_long_content(session: aiohttp.ClientSession, title: str, content: str) -> str:
+    """Map step: summarizes each tile in parallel and returns the joined notes (or a plain prefix on failure)."""
+    tiles = split_into_tiles(content)[:SUMMARY_MAX_TILES]
+    tile_notes = await asyncio.gather(*(summarize_tile(session, title, tile) for tile in tiles))
+    notes = [n for n in tile_notes if n]
+    if not notes:
+        return content[:SUMMARY_TILE_CHARS]
+    return "\n\n".join(notes)
+
 async def generate_paper_summary(session: aiohttp.ClientSession, paper: Dict) -> str:
     content = paper.get("full_content") or paper.get("abstract")
-    if not content or len(content) < 100:
+    if not content or len(content) < PAPER_SUMMARY_MIN_CHARS:
         return "Not enough content available to generate a summary."
 
+    # Reduce step input: tile notes for long texts, the raw content otherwise
+    prompt_content = content[:SUMMARY_TILE_CHARS]
+    if len(content) > SUMMARY_TILE_CHARS:
+        prompt_content = await condense_long_content(session, paper.get("title", "Untitled"), content)
+
     prompt = f"""
     You are an expert research summarizer. Read the content below and produce a detailed, clear summary of this research paper.
     Provide a multi-paragraph summary (approx. 250-600 words) with the following labeled sections when applicable:
@@ -299,7 +659,7 @@ async def generate_paper_summary(session: aiohttp.ClientSession, paper: Dict) ->
 
     Paper Title: {paper.get("title", "Untitled")}
     Content:
-    {content[:4000]}
+    {prompt_content}
     
     Write the summary now, using the labeled sections above.
     """
@@ -320,8 +680,10 @@ async def generate_author_summary(session: aiohttp.ClientSession, author_info: D
     num_cited = min(max(5, int(sample_size * 0.6)), sample_size)
     num_recent = sample_size - num_cited
     
-    cited_sorted = sorted(papers, key=lambda p: p.get("cited_by_count", 0), reverse=True)
-    recent_sorted = sorted(papers, key=lambda p: p.get("publication_year", 0) or 0, reverse=True)
+    # Only the head of each ranking is read: at most num_cited cited papers, and
+    # the recent pass skips at most those, so partial selection replaces full sorts
+    cited_sorted = heapq.nlargest(num_cited, papers, key=lambda p: p.get("cited_by_count", 0))
+    recent_sorted = heapq.nlargest(sample_size, papers, key=lambda p: p.get("publication_year", 0) or 0)
     
     selected_papers = []
     seen_ids = set()
@@ -344,10 +706,15 @@ async def generate_author_summary(session: aiohttp.ClientSession, author_info: D
             selected_papers.append(p)
             seen_ids.add(paper_id)
 
+    with_content = [p for p in selected_papers if p.get("full_content") or p.get("abstract")]
+    if len(with_content) >= AUTHOR_SUMMARY_MIN_PAPERS:
+        selected_papers = with_content
+    per_paper_chars = min(2000, AUTHOR_SUMMARY_CONTENT_BUDGET // max(1, len(selected_papers)))
+
     # Build detailed context for the prompt
     papers_text = []
     for i, p in enumerate(selected_papers, 1):
-        content_snippet = (p.get("full_content") or p.get("abstract", ""))[:2000]
+        content_snippet = trim_to_last_sentence((p.get("full_content") or p.get("abstract", ""))[:per_paper_chars])
         coauthors_str = ", ".join([ca["name"] for ca in p.get("coauthors", [])[:3]])
         
         paper_info = (
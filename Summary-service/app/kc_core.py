@@ -8,15 +8,24 @@ Features:
 - Downloads and parses PDFs from multiple sources
 - Shows co-authors and their affiliations
 - Generates detailed summaries using GroqCloud (primary), OpenAI GPT-4o-mini (fallback), and rule-based (final fallback)
+
+Models: summaries use GROQ_MODEL (70B by default) for quality; domain
+classification uses GROQ_CLASSIFY_MODEL (8B by default), which is much
+faster and cheaper per token and accurate enough for picking labels from a
+fixed list. Set GROQ_CLASSIFY_MODEL=$GROQ_MODEL to classify with the large model.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import argparse
 import asyncio
 import aiohttp
 import re
+import string
 # Use GroqCloud (OpenAI-compatible) for LLM calls if GROQ_API_KEY is provided.
 # The script will fall back to rule-based summary if both Groq and OpenAI calls fail.
-from typing import List, Dict, Optional, Set
+from typing import Callable, Iterator, List, Dict, Optional, Set
 from collections import Counter
 import xml.etree.ElementTree as ET
 import os
@@ -26,8 +35,17 @@ import base64
 import io
 from urllib.parse import quote
 import time
-import json
+import random
+import threading
+from datetime import timedelta
+import orjson
+import sqlite3
+from contextlib import closing
 import hashlib
+import heapq
+import xxhash
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import multiprocessing
 
 # -----------------------------
 # LLM Configuration
@@ -35,13 +53,33 @@ import hashlib
 LLM_MODEL = os.environ.get("LLM_MODEL", "llama3.3:70b")
 # Groq settings (use GROQ_API_KEY env var). Default Groq model id:
 GROQ_MODEL = os.environ.get("GROQ_MODEL", "llama-3.3-70b-versatile")
+# Domain classification only picks labels from a fixed list, so it runs on a
+# smaller, faster model; summaries keep GROQ_MODEL
+GROQ_CLASSIFY_MODEL = os.environ.get("GROQ_CLASSIFY_MODEL", "llama-3.1-8b-instant")
 GROQ_API_KEY = os.environ.get("GROQ_API_KEY", None)
 # OpenAI fallback model
 OPENAI_MODEL = os.environ.get("OPENAI_MODEL", "gpt-4o-mini")
+# Groq account limits used to pace requests proactively (0 disables a limit)
+GROQ_RPM = int(os.environ.get("GROQ_RPM", "30"))
+GROQ_TPM = int(os.environ.get("GROQ_TPM", "0"))
+# Per-attempt bound on a Groq completion; a timed-out attempt is retried
+# immediately instead of waiting on a slow outlier
+GROQ_TIMEOUT = float(os.environ.get("GROQ_TIMEOUT", "30"))
+# Per-call diagnostics (prompt sizes, key check) are printed only with KC_DEBUG=1
+DEBUG = os.environ.get("KC_DEBUG") == "1"
 
 # -----------------------------
 # Helpers: sanitize text and manage GROQ API key
 # -----------------------------
+# Tags are bounded in length so a stray "<" in PDF text can't make every
+# later "<" rescan the rest of the document
+_TAG_RE = re.compile(r"<[^>]{1,4096}>")
+_COPYRIGHT_LINE_RE = re.compile(r"(?im)^.*copyright.*$")
+_RIGHTS_RESERVED_LINE_RE = re.compile(r"(?im)^.*all rights reserved.*$")
+_WS_RE = re.compile(r"\s+")
+_SUMMARY_HEADING_RE = re.compile(r"^\s*Summary\s*:\s*", re.I)
+_ARXIV_ABS_RE = re.compile(r"arxiv\.org/abs/(\d+\.\d+)")
+
 def sanitize_text(text: Optional[str]) -> str:
     """Clean extracted/abstract text before summarization/display.
 
@@ -56,14 +94,18 @@ def sanitize_text(text: Optional[str]) -> str:
     text = str(text)
 
     # Remove XML/HTML tags like <jats:p> and any angle-bracketed tags
-    text = re.sub(r"<[^>]+>", " ", text)
+    text = _TAG_RE.sub(" ", text)
 
-    # Remove common copyright/footer lines
-    text = re.sub(r"(?im)^.*copyright.*$", " ", text)
-    text = re.sub(r"(?im)^.*all rights reserved.*$", " ", text)
+    # Remove common copyright/footer lines. The line regexes backtrack over
+    # every line, so they only run when a plain substring check finds a hit
+    lowered = text.lower()
+    if "copyright" in lowered:
+        text = _COPYRIGHT_LINE_RE.sub(" ", text)
+    if "all rights reserved" in lowered:
+        text = _RIGHTS_RESERVED_LINE_RE.sub(" ", text)
 
     # Replace multiple whitespace/newlines with single space
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WS_RE.sub(" ", text).strip()
     return text
 
 
@@ -85,12 +127,12 @@ def trim_to_last_sentence(text: str) -> str:
     return text.strip()
 
 
-def get_groq_api_key_interactive() -> Optional[str]:
+def get_groq_api_key_interactive(prompt: bool = True) -> Optional[str]:
     """Obtain GROQ API key from environment, well-known files, or interactively from user.
 
     This does not persist the key into the repository. It offers to save the
     key to the user's home directory (~/.groq_api_key) with restrictive
-    permissions for convenience.
+    permissions for convenience. With `prompt=False` the user is never asked.
     """
     # 1) environment
     key = os.environ.get("GROQ_API_KEY")
@@ -112,6 +154,8 @@ def get_groq_api_key_interactive() -> Optional[str]:
             continue
 
     # 3) Interactive prompt (if running interactively)
+    if not prompt:
+        return None
     try:
         print("⚠️  GROQ_API_KEY environment variable not set.")
         key_input = input("Paste your GROQ API key now (or press Enter to skip): ").strip()
@@ -138,39 +182,173 @@ def get_groq_api_key_interactive() -> Optional[str]:
         # Non-interactive environment: give up
         return None
 
-# Local cache for domain classifications to avoid repeated LLM calls
+# Local cache for domain classifications to avoid repeated LLM calls.
+# Stored in SQLite so each classified paper is an O(1) upsert instead of a
+# full-file rewrite; entries from the legacy JSON file are imported once.
+DOMAIN_CACHE_DB = os.path.join(os.path.dirname(__file__), "domain_cache.sqlite")
 DOMAIN_CACHE_FILE = os.path.join(os.path.dirname(__file__), "domain_cache.json")
 
 
+def _open_domain_cache() -> sqlite3.Connection:
+    conn = sqlite3.connect(DOMAIN_CACHE_DB)
+    conn.execute("CREATE TABLE IF NOT EXISTS domain_cache (k TEXT PRIMARY KEY, v TEXT NOT NULL)")
+    return conn
+
+
 def load_domain_cache() -> Dict:
     try:
-        if os.path.exists(DOMAIN_CACHE_FILE):
-            with open(DOMAIN_CACHE_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
+        with closing(_open_domain_cache()) as conn:
+            cache = {k: orjson.loads(v) for k, v in conn.execute("SELECT k, v FROM domain_cache")}
+            if not cache and os.path.exists(DOMAIN_CACHE_FILE):
+                with open(DOMAIN_CACHE_FILE, "rb") as f:
+                    cache = orjson.loads(f.read())
+                with conn:
+                    conn.executemany("INSERT OR REPLACE INTO domain_cache VALUES (?, ?)",
+                                     ((k, orjson.dumps(v).decode()) for k, v in cache.items()))
+            return cache
     except Exception:
         pass
     return {}
 
 
-def save_domain_cache(cache: Dict):
+def save_domain_cache(entries: Dict):
+    """Upsert the given classification entries (not the whole cache)."""
+    if not entries:
+        return
+    try:
+        with closing(_open_domain_cache()) as conn, conn:
+            conn.executemany("INSERT OR REPLACE INTO domain_cache VALUES (?, ?)",
+                             ((k, orjson.dumps(v).decode()) for k, v in entries.items()))
+    except Exception:
+        pass
+
+# On-disk cache of LLM responses keyed by a hash of the full request, so
+# re-summarizing the same paper (or re-classifying the same batch) is free.
+LLM_CACHE_DIR = os.environ.get("LLM_CACHE_DIR", os.path.join(os.path.dirname(__file__), "llm_cache"))
+# Entries expire with the Neo4j cache's 15-day staleness, so content that is
+# regenerated because Neo4j went stale gets a fresh completion, not a replay
+LLM_CACHE_DAYS = int(os.environ.get("LLM_CACHE_DAYS", "15"))
+
+try:
+    import diskcache
+    _llm_cache = diskcache.Cache(LLM_CACHE_DIR)
+except ImportError:
+    _llm_cache = None
+
+
+def llm_cache_key(provider: str, model: str, prompt: str, max_tokens: int, temperature: float) -> str:
+    return xxhash.xxh3_128_hexdigest(f"{provider}|{model}|{max_tokens}|{temperature}|{prompt}".encode())
+
+
+def llm_cache_get(key: str) -> Optional[str]:
+    if _llm_cache is None:
+        return None
+    try:
+        return _llm_cache.get(key)
+    except Exception:
+        return None
+
+
+def llm_cache_set(key: str, value: str, expire: Optional[float] = None):
+    if _llm_cache is None or not value:
+        return
+    if expire is None:
+        expire = LLM_CACHE_DAYS * 86400
     try:
-        with open(DOMAIN_CACHE_FILE, "w", encoding="utf-8") as f:
-            json.dump(cache, f, ensure_ascii=False, indent=2)
+        _llm_cache.set(key, value, expire=expire)
     except Exception:
         pass
 
 
-def generate_with_groq(prompt: str, model: str = None, max_tokens: int = 1024, temperature: float = 0.2, max_retries: int = 3) -> str:
+# Shared keep-alive session so repeated Groq calls reuse TLS connections;
+# the pool is sized for the concurrent classification/summary callers
+_groq_session = requests.Session()
+_groq_session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+
+def warm_groq_session() -> None:
+    """Open a keep-alive connection to Groq ahead of the first completion.
+
+    A cheap authenticated GET on the models listing pays the TCP/TLS setup
+    while the caller is still busy (user input, paper fetching), so the first
+    summary request goes straight out on a warm connection. Failures are ignored.
+    """
+    api_key = os.environ.get("GROQ_API_KEY") or GROQ_API_KEY
+    headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+    try:
+        _groq_session.get("https://api.groq.com/openai/v1/models", headers=headers, timeout=5).close()
+    except requests.exceptions.RequestException:
+        pass
+
+
+class GroqRateLimiter:
+    """Token-bucket pacing for Groq requests/min and tokens/min.
+
+    Callers block in `acquire` until both buckets hold enough capacity, so
+    requests go out at the allowed rate instead of bouncing off 429s and
+    sitting in exponential backoff. Thread-safe for the thread-pool callers.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int = 0):
+        self.req_capacity = requests_per_minute
+        self.tok_capacity = tokens_per_minute
+        self.req_available = float(requests_per_minute)
+        self.tok_available = float(tokens_per_minute)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self.updated
+        self.updated = now
+        if self.req_capacity:
+            self.req_available = min(self.req_capacity, self.req_available + elapsed * self.req_capacity / 60)
+        if self.tok_capacity:
+            self.tok_available = min(self.tok_capacity, self.tok_available + elapsed * self.tok_capacity / 60)
+
+    def acquire(self, tokens: int = 0):
+        if self.tok_capacity:
+            # A single request larger than the bucket can only wait for a full one
+            tokens = min(tokens, self.tok_capacity)
+        while True:
+            with self.lock:
+                self._refill()
+                wait = 0.0
+                if self.req_capacity and self.req_available < 1:
+                    wait = (1 - self.req_available) * 60 / self.req_capacity
+                if self.tok_capacity and self.tok_available < tokens:
+                    wait = max(wait, (tokens - self.tok_available) * 60 / self.tok_capacity)
+                if wait <= 0:
+                    if self.req_capacity:
+                        self.req_available -= 1
+                    if self.tok_capacity:
+                        self.tok_available -= tokens
+                    return
+            time.sleep(wait)
+
+
+groq_limiter = GroqRateLimiter(GROQ_RPM, GROQ_TPM)
+
+
+def generate_with_groq(prompt: str, model: str = None, max_tokens: int = 1024, temperature: float = 0.2, max_retries: int = 3,
+                       max_timeouts: Optional[int] = None) -> str:
     """Call GroqCloud's OpenAI-compatible Chat Completions endpoint with retry logic.
 
     Returns the generated text, or raises an exception on HTTP/errors.
+    Responses are served from the LLM cache when the same request was made before.
+    `max_timeouts` caps how many of the `max_retries` attempts may time out
+    (default: all of them), so slow calls can give up early without
+    shrinking the rate-limit retry budget.
     """
+    model = model or GROQ_MODEL
+    cache_key = llm_cache_key("groq", model, prompt, max_tokens, temperature)
+    cached = llm_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
     api_key = os.environ.get("GROQ_API_KEY") or GROQ_API_KEY
-    # print(prompt length only for debug
-    try:
+    if DEBUG:
         print(f"[DEBUG] prompt length: {len(prompt)}")
-    except Exception:
-        pass
 
     if not api_key:
         # Attempt to load interactively or from well-known files
@@ -178,7 +356,6 @@ def generate_with_groq(prompt: str, model: str = None, max_tokens: int = 1024, t
         if not api_key:
             raise RuntimeError("GROQ_API_KEY environment variable not set")
 
-    model = model or GROQ_MODEL
     url = "https://api.groq.com/openai/v1/chat/completions"
     payload = {
         "model": model,
@@ -193,18 +370,31 @@ def generate_with_groq(prompt: str, model: str = None, max_tokens: int = 1024, t
     }
 
     # Retry with exponential backoff for rate limiting
+    # Rough token estimate (~4 chars/token) plus the completion budget
+    estimated_tokens = len(prompt) // 4 + max_tokens
+    timeouts = 0
     for attempt in range(max_retries):
         try:
-            resp = requests.post(url, headers=headers, json=payload, timeout=120)
+            groq_limiter.acquire(estimated_tokens)
+            # The response body arrives only once generation finishes, so the
+            # read timeout bounds the whole completion
+            resp = _groq_session.post(url, headers=headers, data=orjson.dumps(payload), timeout=(5, GROQ_TIMEOUT))
             resp.raise_for_status()
-            data = resp.json()
+            data = orjson.loads(resp.content)
             break
+        except requests.exceptions.Timeout:
+            timeouts += 1
+            if attempt < max_retries - 1 and timeouts < (max_timeouts or max_retries):
+                print(f"   ⏳ Groq call exceeded {GROQ_TIMEOUT:.0f}s. Retrying... (attempt {attempt + 1}/{max_retries})")
+                continue
+            raise
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 429:  # Rate limit
                 if attempt < max_retries - 1:
                     wait_time = (2 ** attempt) * 2  # 2, 4, 8 seconds
                     print(f"   ⏳ Rate limited. Retrying in {wait_time} seconds... (attempt {attempt + 1}/{max_retries})")
-                    print(e)
+                    if DEBUG:
+                        print(f"[DEBUG] {e}")
                     time.sleep(wait_time)
                     continue
             raise
@@ -227,20 +417,96 @@ def generate_with_groq(prompt: str, model: str = None, max_tokens: int = 1024, t
                 if isinstance(msg, dict):
                     content = msg.get("content") or msg.get("text")
                     if content:
+                        llm_cache_set(cache_key, content)
                         return content
             # fallback: text
             text = first.get("text")
             if text:
+                llm_cache_set(cache_key, text)
                 return text
     except Exception:
         pass
 
     # other possible field
     if isinstance(data.get("output_text"), str):
+        llm_cache_set(cache_key, data.get("output_text"))
         return data.get("output_text")
 
     # last resort: stringify entire response
-    return json.dumps(data)
+    return orjson.dumps(data).decode()
+
+
+def generate_with_groq_stream(prompt: str, model: str = None, max_tokens: int = 1024, temperature: float = 0.2,
+                              max_retries: int = 3) -> Iterator[str]:
+    """Stream a Groq chat completion, yielding content deltas as they arrive.
+
+    Rate limits and timeouts are retried with the same backoff as
+    `generate_with_groq`, but only until the first chunk has been yielded.
+    The joined text is stored in the same LLM cache entry `generate_with_groq`
+    uses, once the stream has ended with [DONE]; a cache hit is yielded as a
+    single chunk. Raises on HTTP/errors.
+    """
+    model = model or GROQ_MODEL
+    cache_key = llm_cache_key("groq", model, prompt, max_tokens, temperature)
+    cached = llm_cache_get(cache_key)
+    if cached is not None:
+        yield cached
+        return
+
+    api_key = os.environ.get("GROQ_API_KEY") or GROQ_API_KEY or get_groq_api_key_interactive()
+    if not api_key:
+        raise RuntimeError("GROQ_API_KEY environment variable not set")
+
+    payload = {
+        "model": model,
+        "messages": [{"role": "user", "content": prompt}],
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+        "stream": True,
+    }
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+
+    parts = []
+    done = False
+    for attempt in range(max_retries):
+        try:
+            groq_limiter.acquire(len(prompt) // 4 + max_tokens)
+            # With streaming, the read timeout bounds the gap between chunks
+            with _groq_session.post("https://api.groq.com/openai/v1/chat/completions", headers=headers,
+                               data=orjson.dumps(payload), timeout=(5, GROQ_TIMEOUT), stream=True) as resp:
+                resp.raise_for_status()
+                # Server-sent events: "data: {json}" lines, terminated by "data: [DONE]"
+                for line in resp.iter_lines():
+                    if not line.startswith(b"data: "):
+                        continue
+                    data = line[6:]
+                    if data == b"[DONE]":
+                        done = True
+                        break
+                    choices = orjson.loads(data).get("choices") or []
+                    delta = (choices[0].get("delta") or {}).get("content") if choices else None
+                    if delta:
+                        parts.append(delta)
+                        yield delta
+            break
+        except requests.exceptions.Timeout:
+            # Text already handed to the caller cannot be taken back
+            if parts or attempt == max_retries - 1:
+                raise
+            print(f"   ⏳ Groq stream exceeded {GROQ_TIMEOUT:.0f}s. Retrying... (attempt {attempt + 1}/{max_retries})")
+        except requests.exceptions.HTTPError as e:
+            if e.response.status_code != 429 or attempt == max_retries - 1:
+                raise
+            wait_time = (2 ** attempt) * 2  # 2, 4, 8 seconds
+            print(f"   ⏳ Rate limited. Retrying in {wait_time} seconds... (attempt {attempt + 1}/{max_retries})")
+            time.sleep(wait_time)
+
+    # A stream cut off before [DONE] is a truncated completion; don't replay it
+    if done:
+        llm_cache_set(cache_key, "".join(parts))
 
 # -----------------------------
 # OpenAI fallback helper
@@ -248,6 +514,10 @@ def generate_with_groq(prompt: str, model: str = None, max_tokens: int = 1024, t
 def generate_with_openai(prompt: str, model: str = None, max_tokens: int = 1024, temperature: float = 0.3) -> str:
     """Call OpenAI API (gpt-4o-mini by default) as a fallback if Groq fails."""
     model = model or OPENAI_MODEL
+    cache_key = llm_cache_key("openai", model, prompt, max_tokens, temperature)
+    cached = llm_cache_get(cache_key)
+    if cached is not None:
+        return cached
     try:
         from openai import OpenAI
         openai_api_key = os.environ.get("OPENAI_API_KEY")
@@ -268,6 +538,7 @@ def generate_with_openai(prompt: str, model: str = None, max_tokens: int = 1024,
         if response.choices and len(response.choices) > 0:
             content = response.choices[0].message.content
             if content:
+                llm_cache_set(cache_key, content.strip())
                 return content.strip()
         
         return ""
@@ -279,17 +550,35 @@ def generate_with_openai(prompt: str, model: str = None, max_tokens: int = 1024,
 # PDF Processing (Pure Python)
 # -----------------------------
 def extract_text_from_pdf(pdf_data: bytes) -> Optional[str]:
-    """Extract text from PDF using pure Python libraries."""
+    """Extract text from PDF, trying pypdfium2 (C++ PDFium) first, then pure-Python libraries."""
     try:
-        # Try using PyPDF2 first
+        # Try pypdfium2 first: several times faster than the pdfminer-based readers
+        try:
+            import pypdfium2 as pdfium
+            pdf = pdfium.PdfDocument(pdf_data)
+            try:
+                pages_text = []
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    pages_text.append(textpage.get_text_range() or "")
+                    textpage.close()
+                    page.close()
+            finally:
+                pdf.close()
+            text = "\n".join(pages_text)
+            if text.strip():
+                return text
+        except ImportError:
+            pass
+        except Exception as e:
+            print(f"⚠️  pypdfium2 extraction failed: {e}")
+
+        # Try using PyPDF2
         try:
             import PyPDF2
             pdf_stream = io.BytesIO(pdf_data)
             reader = PyPDF2.PdfReader(pdf_stream)
-            text = ""
-            for page in reader.pages:
-                page_text = page.extract_text() or ""
-                text += page_text + "\n"
+            text = "\n".join(page.extract_text() or "" for page in reader.pages)
             if text.strip():
                 return text
         except ImportError:
@@ -302,10 +591,7 @@ def extract_text_from_pdf(pdf_data: bytes) -> Optional[str]:
             import pdfplumber
             pdf_stream = io.BytesIO(pdf_data)
             with pdfplumber.open(pdf_stream) as pdf:
-                text = ""
-                for page in pdf.pages:
-                    page_text = page.extract_text() or ""
-                    text += page_text + "\n"
+                text = "\n".join(page.extract_text() or "" for page in pdf.pages)
                 if text.strip():
                     return text
         except ImportError:
@@ -318,6 +604,55 @@ def extract_text_from_pdf(pdf_data: bytes) -> Optional[str]:
         print(f"⚠️  Error extracting PDF text: {e}")
         return None
 
+# PDF parsing is CPU-bound and holds the GIL; run it in worker processes so
+# concurrent downloads in enrich_papers_with_content keep the event loop free.
+# Workers are never forked from this (by then multi-threaded) process: a fork
+# taken while another thread holds a lock, e.g. stdout's, can deadlock the child.
+PDF_WORKERS = int(os.environ.get("PDF_WORKERS", os.cpu_count() or 2))
+_PDF_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn")
+_pdf_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_pdf_executor() -> ProcessPoolExecutor:
+    """Return the shared PDF extraction process pool, creating it on first use."""
+    global _pdf_executor
+    if _pdf_executor is None:
+        _pdf_executor = ProcessPoolExecutor(max_workers=PDF_WORKERS, mp_context=_PDF_MP_CONTEXT)
+    return _pdf_executor
+
+
+async def extract_text_from_pdf_async(pdf_data: bytes) -> Optional[str]:
+    """Run extract_text_from_pdf in the process pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_pdf_executor(), extract_text_from_pdf, pdf_data)
+
+
+# Larger PDFs are skipped: with several papers downloading at once, whole
+# bodies in memory add up, and such files are rarely a single paper anyway
+MAX_PDF_BYTES = int(os.environ.get("MAX_PDF_MB", "25")) * 1024 * 1024
+PDF_READ_CHUNK = 64 * 1024
+# PDF GETs get their own deadline: the session default only bounds connect
+# and per-read stalls, which a slow but steady 25 MB download never trips
+PDF_DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(
+    total=float(os.environ.get("PDF_DOWNLOAD_TIMEOUT", "60")), sock_connect=10, sock_read=30
+)
+
+
+async def read_pdf_body(resp) -> Optional[bytes]:
+    """Stream a PDF response body, giving up once it exceeds MAX_PDF_BYTES."""
+    try:
+        if int(resp.headers.get("Content-Length", "0")) > MAX_PDF_BYTES:
+            return None
+    except ValueError:
+        pass
+    body = bytearray()
+    async for chunk in resp.content.iter_chunked(PDF_READ_CHUNK):
+        body.extend(chunk)
+        if len(body) > MAX_PDF_BYTES:
+            return None
+    return bytes(body)
+
 # -----------------------------
 # Text Processing and Deduplication
 # -----------------------------
@@ -326,90 +661,238 @@ def normalize_text(text: str) -> str:
     if not text:
         return ""
     # Remove extra whitespace, convert to lowercase
-    text = re.sub(r'\s+', ' ', text.strip())
+    text = _WS_RE.sub(' ', text.strip())
     return text.lower()
 
-def get_text_hash(text: str) -> str:
-    """Get hash of normalized text for comparison."""
+_TITLE_PUNCT = str.maketrans("", "", string.punctuation)
+
+def normalize_title(title: Optional[str]) -> str:
+    """Case-fold a title and strip punctuation so variants of it compare equal."""
+    if not title:
+        return ""
+    return _WS_RE.sub(' ', title.casefold().translate(_TITLE_PUNCT)).strip()
+
+def get_text_hash(text: str) -> int:
+    """Get a 64-bit fingerprint of normalized text for comparison.
+
+    This is an identity check only, so a fast non-cryptographic hash (xxh3)
+    is used; the int result is also cheaper to compare and store than a hex
+    digest.
+    """
     normalized = normalize_text(text)
-    return hashlib.md5(normalized.encode()).hexdigest()
+    return xxhash.xxh3_64_intdigest(normalized.encode())
 
-def is_duplicate(text1: str, text2: str, threshold: float = 0.9) -> bool:
-    """Check if two texts are duplicates using similarity threshold."""
-    if not text1 or not text2:
+def prepare_for_dedup(text: str) -> tuple:
+    """Precompute what duplicate checks compare: (raw length, normalized text, hash, token set).
+
+    Computing this once per content item keeps deduplication from
+    re-normalizing, re-hashing and re-tokenizing the same (often very long)
+    text on every pairwise comparison. The token set is only needed for the
+    similarity branch, which applies to texts over 100 characters.
+    """
+    normalized = normalize_text(text)
+    tokens = frozenset(normalized.split()) if len(normalized) > 100 else frozenset()
+    return len(text), normalized, xxhash.xxh3_64_intdigest(normalized.encode()), tokens
+
+def _contains(outer: str, outer_tokens: frozenset, inner: str, inner_tokens: frozenset) -> bool:
+    """Substring test with a token-set short-circuit.
+
+    If `inner` occurs in `outer`, every token of `inner` except the two at its
+    boundaries is also a whole token of `outer`, so more than two missing
+    tokens rules containment out without scanning the (possibly long) text.
+    """
+    if len(inner) > len(outer):
+        return False
+    if inner_tokens and outer_tokens and len(inner_tokens - outer_tokens) > 2:
         return False
+    return inner in outer
+
+def is_duplicate_prepared(prepared1: tuple, prepared2: tuple, threshold: float = 0.9) -> bool:
+    """Duplicate check over two `prepare_for_dedup` results."""
+    len1, norm1, hash1, tokens1 = prepared1
+    len2, norm2, hash2, tokens2 = prepared2
 
     # Quick hash check first
-    if get_text_hash(text1) == get_text_hash(text2):
+    if hash1 == hash2:
         return True
 
     # For short texts, check exact match after normalization
-    if len(text1) < 200 and len(text2) < 200:
-        return normalize_text(text1) == normalize_text(text2)
+    if len1 < 200 and len2 < 200:
+        return norm1 == norm2
 
     # For longer texts, check if one is contained in the other
-    norm1 = normalize_text(text1)
-    norm2 = normalize_text(text2)
-
-    if norm1 in norm2 or norm2 in norm1:
+    if _contains(norm2, tokens2, norm1, tokens1) or _contains(norm1, tokens1, norm2, tokens2):
         return True
 
     # Check similarity ratio for longer texts
     if len(norm1) > 100 and len(norm2) > 100:
-        # Simple similarity check
-        common_words = set(norm1.split()) & set(norm2.split())
-        total_words = set(norm1.split()) | set(norm2.split())
-        if total_words:
-            similarity = len(common_words) / len(total_words)
+        # Jaccard is at most min(|A|, |B|) / max(|A|, |B|), so sets too
+        # different in size can't pass the threshold; skip the intersection
+        if min(len(tokens1), len(tokens2)) <= threshold * max(len(tokens1), len(tokens2)):
+            return False
+        # Jaccard over the precomputed token sets; |A ∪ B| = |A| + |B| - |A ∩ B|
+        common = len(tokens1 & tokens2)
+        total = len(tokens1) + len(tokens2) - common
+        if total:
+            similarity = common / total
             return similarity > threshold
 
     return False
 
+def is_duplicate(text1: str, text2: str, threshold: float = 0.9) -> bool:
+    """Check if two texts are duplicates using similarity threshold."""
+    if not text1 or not text2:
+        return False
+    return is_duplicate_prepared(prepare_for_dedup(text1), prepare_for_dedup(text2), threshold)
+
 def deduplicate_content(content_list: List[tuple]) -> List[tuple]:
     """Remove duplicate content from a list of (content, source) tuples."""
     if not content_list:
         return []
 
     unique_content = []
-    seen_hashes: Set[str] = []
+    unique_prepared = []  # prepare_for_dedup() results, parallel to unique_content
+    seen_hashes: Set[int] = set()
 
     for content, source in content_list:
         if not content or not content.strip():
             continue
 
-        content_hash = get_text_hash(content)
+        prepared = prepare_for_dedup(content)
+        content_hash = prepared[2]
 
         # Check if this content is a duplicate of anything we've seen
-        is_dup = False
-        for seen_hash in seen_hashes:
-            if content_hash == seen_hash:
-                is_dup = True
-                break
+        is_dup = content_hash in seen_hashes
 
         # Also check against existing unique content for near-duplicates
         if not is_dup:
-            for existing_content, _ in unique_content:
-                if is_duplicate(content, existing_content):
+            for existing_prepared in unique_prepared:
+                if is_duplicate_prepared(prepared, existing_prepared):
                     is_dup = True
                     break
 
         if not is_dup:
             unique_content.append((content, source))
-            seen_hashes.append(content_hash)
+            unique_prepared.append(prepared)
+            seen_hashes.add(content_hash)
 
     return unique_content
 
+# -----------------------------
+# HTTP Caching for External APIs
+# -----------------------------
+# OpenAlex/Crossref/Unpaywall/Semantic Scholar responses are stable, so GETs
+# are cached on disk when requests-cache / aiohttp-client-cache are installed.
+HTTP_CACHE_DIR = os.environ.get("HTTP_CACHE_DIR", os.path.dirname(__file__))
+HTTP_CACHE_TTL = timedelta(days=int(os.environ.get("HTTP_CACHE_DAYS", "14")))
+
+try:
+    import requests_cache
+    http_session = requests_cache.CachedSession(
+        os.path.join(HTTP_CACHE_DIR, "http_cache"), backend="sqlite", expire_after=HTTP_CACHE_TTL
+    )
+except ImportError:
+    http_session = requests.Session()
+# Keep-alive pool for the synchronous OpenAlex lookups; throttled and transient
+# server errors are retried by urllib3, honoring Retry-After
+http_session.mount("https://", HTTPAdapter(
+    pool_connections=10, pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=1, status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=("GET", "HEAD"), respect_retry_after_header=True, raise_on_status=False),
+))
+
+
+# One session is shared per pipeline run, so its connector bounds every
+# OpenAlex/enrichment request in flight together.
+HTTP_CONNECTION_LIMIT = int(os.environ.get("HTTP_CONNECTION_LIMIT", "32"))
+# Per-socket limits rather than a total: on the shared session a total would
+# also count time spent waiting for a pooled connection under load
+HTTP_TIMEOUT = float(os.environ.get("HTTP_TIMEOUT", "15"))
+HTTP_CONNECT_TIMEOUT = float(os.environ.get("HTTP_CONNECT_TIMEOUT", "10"))
+
+
+def is_cacheable_response(response) -> bool:
+    """Keep PDF downloads out of the HTTP cache.
+
+    Saving a response reads its whole body before the caller sees it, which
+    would bypass read_pdf_body's MAX_PDF_BYTES cap and fill the SQLite store
+    with binaries. The filter runs before the body is read.
+    """
+    content_type = (response.headers.get("Content-Type") or "").lower()
+    if "pdf" in content_type or "octet-stream" in content_type:
+        return False
+    if str(response.url).lower().endswith(".pdf"):
+        return False
+    try:
+        return int(response.headers.get("Content-Length") or 0) <= MAX_PDF_BYTES
+    except ValueError:
+        return True
+
+
+def open_http_session():
+    """Return an aiohttp session backed by the on-disk cache when available."""
+    session_kwargs = {
+        # Keep idle connections and DNS answers around long enough to be
+        # reused by the next burst of requests to the same hosts
+        "connector": aiohttp.TCPConnector(limit=HTTP_CONNECTION_LIMIT, keepalive_timeout=60, ttl_dns_cache=300),
+        "timeout": aiohttp.ClientTimeout(total=None, sock_connect=HTTP_CONNECT_TIMEOUT, sock_read=HTTP_TIMEOUT),
+    }
+    try:
+        from aiohttp_client_cache import CachedSession, SQLiteBackend
+        # POST is cached too: the Semantic Scholar batch lookup is a read keyed
+        # by its request body (the DOI list)
+        return CachedSession(cache=SQLiteBackend(
+            os.path.join(HTTP_CACHE_DIR, "aiohttp_cache.sqlite"), expire_after=HTTP_CACHE_TTL,
+            allowed_methods=("GET", "HEAD", "POST"), filter_fn=is_cacheable_response,
+        ), **session_kwargs)
+    except ImportError:
+        return aiohttp.ClientSession(**session_kwargs)
+
+
+# OpenAlex allows 10 requests/second; parallel page fetches and batch runs are
+# spaced to that rate so bursts don't come back as 429s
+OPENALEX_REQUESTS_PER_SECOND = float(os.environ.get("OPENALEX_REQUESTS_PER_SECOND", "10"))
+_openalex_next_slot = 0.0
+
+
+async def _openalex_pace():
+    """Wait for the next OpenAlex request slot."""
+    global _openalex_next_slot
+    if OPENALEX_REQUESTS_PER_SECOND <= 0:
+        return
+    # Slots are claimed without awaiting, so concurrent tasks on the loop
+    # each get a distinct one
+    now = time.monotonic()
+    slot = max(now, _openalex_next_slot)
+    _openalex_next_slot = slot + 1 / OPENALEX_REQUESTS_PER_SECOND
+    if slot > now:
+        await asyncio.sleep(slot - now)
+
+
+async def _fetch_json(session, url: str, params: Optional[dict] = None):
+    """GET an OpenAlex JSON document through a shared aiohttp session."""
+    await _openalex_pace()
+    async with session.get(url, params=params) as resp:
+        resp.raise_for_status()
+        return orjson.loads(await resp.read())
+
 # -----------------------------
 # OpenAlex Author & Paper Fetching
 # -----------------------------
 def fetch_author_candidates(author_name: str, max_results: int = 10):
     """Fetch multiple author candidates from OpenAlex."""
     url = f"https://api.openalex.org/authors?search={quote(author_name)}&per-page={max_results}"
-    r = requests.get(url)
+    r = http_session.get(url)
     r.raise_for_status()
-    authors = r.json().get("results", [])
+    authors = orjson.loads(r.content).get("results", [])
     return authors
 
+async def fetch_author_candidates_async(session, author_name: str, max_results: int = 10):
+    """Async variant of fetch_author_candidates that reuses the caller's session."""
+    url = f"https://api.openalex.org/authors?search={quote(author_name)}&per-page={max_results}"
+    data = await _fetch_json(session, url)
+    return data.get("results", [])
+
 def fetch_author_by_id(author_id: str) -> Optional[Dict]:
     """
     Fetches a single author's full details from OpenAlex using their ID.
@@ -423,12 +906,12 @@ def fetch_author_by_id(author_id: str) -> Optional[Dict]:
     url = f"https://api.openalex.org/authors/{author_id}"
 
     try:
-        r = requests.get(url)
+        r = http_session.get(url)
         # Raises an HTTPError for bad responses (4xx or 5xx)
         r.raise_for_status()
 
         # If successful, the JSON body is the author object itself
-        return r.json()
+        return orjson.loads(r.content)
 
     except requests.exceptions.HTTPError as e:
         # Gracefully handle the case where the author is not found (404)
@@ -443,6 +926,53 @@ def fetch_author_by_id(author_id: str) -> Optional[Dict]:
         return None
 
 
+async def fetch_author_by_id_async(session, author_id: str) -> Optional[Dict]:
+    """Async variant of fetch_author_by_id that reuses the caller's session."""
+    if "openalex.org/" in author_id:
+        author_id = author_id.split('/')[-1]
+
+    url = f"https://api.openalex.org/authors/{author_id}"
+
+    try:
+        return await _fetch_json(session, url)
+    except aiohttp.ClientResponseError as e:
+        if e.status == 404:
+            print(f"⚠️  Author with ID '{author_id}' not found.")
+        else:
+            print(f"⚠️  HTTP error fetching author ID '{author_id}': {e}")
+        return None
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        print(f"⚠️  Network request failed for author ID '{author_id}': {e}")
+        return None
+
+
+# OpenAlex accepts up to 100 OR-ed values per filter; stay well under it
+OPENALEX_ID_BATCH_SIZE = 50
+
+
+async def fetch_authors_by_ids_async(session, author_ids: List[str]) -> Dict[str, Dict]:
+    """Fetch many OpenAlex authors with one filter=openalex:A1|A2|... request per chunk.
+
+    Returns {short author ID: author}; IDs that are not found are missing from
+    the result, and a failed chunk is reported and skipped.
+    """
+    short_ids = list(dict.fromkeys(aid.split('/')[-1] for aid in author_ids))
+    chunks = [short_ids[i:i + OPENALEX_ID_BATCH_SIZE] for i in range(0, len(short_ids), OPENALEX_ID_BATCH_SIZE)]
+
+    async def fetch_chunk(chunk: List[str]) -> List[dict]:
+        url = f"https://api.openalex.org/authors?filter=openalex:{'|'.join(chunk)}&per-page={len(chunk)}"
+        try:
+            return (await _fetch_json(session, url)).get("results", [])
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"⚠️  Network request failed for {len(chunk)} author IDs: {e}")
+            return []
+
+    authors = {}
+    for results in await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks)):
+        for author in results:
+            authors[author.get("id", "").split('/')[-1]] = author
+    return authors
+
 
 def fetch_paper_by_id(paper_id: str) -> Optional[Dict]:
     """
@@ -457,12 +987,12 @@ def fetch_paper_by_id(paper_id: str) -> Optional[Dict]:
     url = f"https://api.openalex.org/works/{paper_id}"
 
     try:
-        r = requests.get(url)
+        r = http_session.get(url)
         # Raises an HTTPError for bad responses (4xx or 5xx)
         r.raise_for_status()
 
         # If successful, the JSON body is the paper object itself
-        return r.json()
+        return orjson.loads(r.content)
 
     except requests.exceptions.HTTPError as e:
         # Gracefully handle the case where the paper is not found (404)
@@ -477,6 +1007,33 @@ def fetch_paper_by_id(paper_id: str) -> Optional[Dict]:
         return None
 
 
+async def fetch_paper_by_id_async(session, paper_id: str) -> Optional[Dict]:
+    """Async variant of fetch_paper_by_id that reuses the caller's session."""
+    if "openalex.org/" in paper_id:
+        paper_id = paper_id.split('/')[-1]
+
+    url = f"https://api.openalex.org/works/{paper_id}"
+
+    try:
+        return await _fetch_json(session, url)
+    except aiohttp.ClientResponseError as e:
+        if e.status == 404:
+            print(f"⚠️  Paper with ID '{paper_id}' not found.")
+        else:
+            print(f"⚠️  HTTP error fetching paper ID '{paper_id}': {e}")
+        return None
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        print(f"⚠️  Network request failed for paper ID '{paper_id}': {e}")
+        return None
+
+
+async def search_works_async(session, title: str, max_results: int = 1) -> List[Dict]:
+    """Search OpenAlex works by title over the caller's session."""
+    url = f"https://api.openalex.org/works?search={quote(title)}&per-page={max_results}"
+    data = await _fetch_json(session, url)
+    return data.get("results", [])
+
+
 def fetch_author_by_orcid(orcid: str) -> Optional[dict]:
     """Fetch an OpenAlex author by ORCID identifier."""
     if not orcid:
@@ -485,15 +1042,24 @@ def fetch_author_by_orcid(orcid: str) -> Optional[dict]:
         # Clean ORCID (remove https://orcid.org/ if present)
         orcid = orcid.strip().replace("https://orcid.org/", "")
         url = f"https://api.openalex.org/authors?filter=orcid:{orcid}"
-        r = requests.get(url)
+        r = http_session.get(url)
         r.raise_for_status()
-        results = r.json().get("results", [])
+        results = orjson.loads(r.content).get("results", [])
         if results:
             return results[0]
     except Exception as e:
         print(f"⚠️  ORCID lookup failed: {e}")
     return None
 
+def resolve_affiliation(author: dict, default: str = "N/A") -> str:
+    """Return the author's last known institution name, or `default`."""
+    name = (author.get("last_known_institution") or {}).get("display_name")
+    if not name:
+        institutions = author.get("last_known_institutions") or []
+        if institutions:
+            name = institutions[0].get("display_name")
+    return name or default
+
 def display_author_candidates(authors: List[dict]) -> dict:
     """Display author candidates and let user select one."""
     print("\n" + "=" * 80)
@@ -508,16 +1074,7 @@ def display_author_candidates(authors: List[dict]) -> dict:
         if orcid and orcid.startswith("https://orcid.org/"):
             orcid = orcid.replace("https://orcid.org/", "")
 
-        # Get affiliation
-        affiliation = "N/A"
-        last_institution = author.get("last_known_institution", {})
-        if last_institution:
-            affiliation = last_institution.get("display_name", "N/A")
-
-        if affiliation == "N/A":
-            institutions = author.get("last_known_institutions", [])
-            if institutions:
-                affiliation = institutions[0].get("display_name", "N/A")
+        affiliation = resolve_affiliation(author)
 
         works_count = author.get("works_count", 0)
         cited_by_count = author.get("cited_by_count", 0)
@@ -579,107 +1136,182 @@ def extract_coauthors(authorships: List[dict], main_author_id: str) -> List[Dict
 
     return coauthors
 
-def fetch_all_openalex_papers(author_id: str, batch_size: int = 100, max_papers: Optional[int] = None):
-    """Fetch all papers for a specific author ID with co-author information."""
-    all_papers = []
-    cursor = "*"
-    has_more = True
+def decode_inverted_abstract(inv_abstract: Dict[str, List[int]]) -> str:
+    """Rebuild abstract text from OpenAlex's {word: [positions]} index.
+
+    Positions are normally a dense 0..n-1 range, so words are scattered
+    straight into their slots without sorting; sparse indexes fall back to
+    sorting (position, word) pairs.
+    """
+    n = sum(map(len, inv_abstract.values()))
+    words = [None] * n
+    try:
+        for word, positions in inv_abstract.items():
+            for pos in positions:
+                words[pos] = word
+    except IndexError:
+        pairs = [(pos, word) for word, positions in inv_abstract.items() for pos in positions]
+        pairs.sort()
+        return " ".join(word for _, word in pairs)
+    if None in words:
+        # Repeated positions leave empty slots; drop them
+        return " ".join(word for word in words if word is not None)
+    return " ".join(words)
+
+
+def parse_openalex_work(item: dict, author_id: str) -> Dict:
+    """Convert one OpenAlex work record into the paper dict used by the pipeline."""
+    # Decode inverted abstract
+    abstract = ""
+    inv_abstract = item.get("abstract_inverted_index")
+    if inv_abstract:
+        try:
+            abstract = decode_inverted_abstract(inv_abstract)
+        except:
+            abstract = ""
+
+    # Get venue
+    primary_location = item.get("primary_location", {})
+    venue = ""
+    if primary_location:
+        source = primary_location.get("source", {})
+        if source:
+            venue = source.get("display_name", "")
+
+    if not venue:
+        venue = item.get("host_venue", {}).get("display_name", "")
+
+    # Get title
+    title = item.get("display_name") or item.get("title", "Untitled")
+
+    # Extract co-authors
+    authorships = item.get("authorships", [])
+    coauthors = extract_coauthors(authorships, author_id)
+
+    # Extract arXiv ID if available
+    arxiv_id = None
+    ids = item.get("ids", {})
+    if ids:
+        arxiv_url = ids.get("arxiv")
+        if arxiv_url:
+            match = _ARXIV_ABS_RE.search(arxiv_url)
+            if match:
+                arxiv_id = match.group(1)
+
+    # Get DOI
+    doi = item.get("doi") or ""
+    if doi:
+        doi = doi.replace("https://doi.org/", "")
+
+    return {
+        "title": title,
+        "year": item.get("publication_year", "N/A"),
+        "venue": venue if venue else "N/A",
+        "cited_by_count": item.get("cited_by_count", 0),
+        "abstract": abstract,
+        "coauthors": coauthors,
+        "arxiv_id": arxiv_id,
+        "doi": doi,
+        "openalex_id": item.get("id", "")
+    }
+
+# OpenAlex only serves page-based pagination for the first 10,000 results
+OPENALEX_PAGE_LIMIT = 10000
+# Root fields read by parse_openalex_work; `select` trims each work record
+# to these, so pages are a fraction of the size to download and parse
+OPENALEX_WORK_FIELDS = ("id", "doi", "title", "display_name", "publication_year", "cited_by_count",
+                        "primary_location", "authorships", "ids", "abstract_inverted_index")
+
+
+async def fetch_all_openalex_papers_async(author_id: str, batch_size: int = 100,
+                                          max_papers: Optional[int] = None,
+                                          max_concurrent: int = 4, session=None) -> List[Dict]:
+    """Fetch all papers for an author, fanning out over OpenAlex pages concurrently.
+
+    The first page reports meta.count, so the remaining pages are requested in
+    parallel (bounded by max_concurrent) instead of walking the cursor serially.
+    Only results past OpenAlex's 10,000-result page limit fall back to the cursor.
+    Pass `session` to share one connection pool with the rest of a pipeline.
+    """
+    if session is None:
+        async with open_http_session() as session:
+            return await fetch_all_openalex_papers_async(author_id, batch_size, max_papers,
+                                                         max_concurrent, session)
+
+    if max_papers:
+        batch_size = min(batch_size, max_papers)
+    base_url = (f"https://api.openalex.org/works?filter=authorships.author.id:{author_id}"
+                f"&sort=cited_by_count:desc&per-page={batch_size}&select={','.join(OPENALEX_WORK_FIELDS)}")
 
     print(f"📚 Fetching all papers for author (this may take a while for prolific authors)...")
 
-    while has_more:
-        url = f"https://api.openalex.org/works?filter=authorships.author.id:{author_id}&sort=cited_by_count:desc&per-page={batch_size}&cursor={cursor}"
+    semaphore = asyncio.Semaphore(max_concurrent)
 
-        try:
-            r = requests.get(url)
-            r.raise_for_status()
-            data = r.json()
+    async def fetch_page(page: int) -> List[dict]:
+        async with semaphore:
+            try:
+                data = await _fetch_json(session, f"{base_url}&page={page}")
+                return data.get("results", [])
+            except Exception as e:
+                print(f"⚠️  Error fetching papers page {page}: {e}")
+                return []
 
-            papers_data = data.get("results", [])
-            if not papers_data:
-                has_more = False
-                break
+    try:
+        first = await _fetch_json(session, f"{base_url}&page=1")
+    except Exception as e:
+        print(f"⚠️  Error fetching papers: {e}")
+        return []
 
-            for item in papers_data:
-                # Decode inverted abstract
-                abstract = ""
-                inv_abstract = item.get("abstract_inverted_index")
-                if inv_abstract:
-                    try:
-                        max_pos = max([max(positions) for positions in inv_abstract.values()])
-                        words = [""] * (max_pos + 1)
-                        for word, positions in inv_abstract.items():
-                            for pos in positions:
-                                words[pos] = word
-                        abstract = " ".join(words)
-                    except:
-                        abstract = ""
-
-                # Get venue
-                primary_location = item.get("primary_location", {})
-                venue = ""
-                if primary_location:
-                    source = primary_location.get("source", {})
-                    if source:
-                        venue = source.get("display_name", "")
-
-                if not venue:
-                    venue = item.get("host_venue", {}).get("display_name", "")
-
-                # Get title
-                title = item.get("display_name") or item.get("title", "Untitled")
-
-                # Extract co-authors
-                authorships = item.get("authorships", [])
-                coauthors = extract_coauthors(authorships, author_id)
-
-                # Extract arXiv ID if available
-                arxiv_id = None
-                ids = item.get("ids", {})
-                if ids:
-                    arxiv_url = ids.get("arxiv")
-                    if arxiv_url:
-                        match = re.search(r'arxiv\.org/abs/(\d+\.\d+)', arxiv_url)
-                        if match:
-                            arxiv_id = match.group(1)
-
-                # Get DOI
-                doi = item.get("doi") or ""
-                if doi:
-                    doi = doi.replace("https://doi.org/", "")
-
-                all_papers.append({
-                    "title": title,
-                    "year": item.get("publication_year", "N/A"),
-                    "venue": venue if venue else "N/A",
-                    "cited_by_count": item.get("cited_by_count", 0),
-                    "abstract": abstract,
-                    "coauthors": coauthors,
-                    "arxiv_id": arxiv_id,
-                    "doi": doi,
-                    "openalex_id": item.get("id", "")
-                })
-
-            # Check if we have more results
-            meta = data.get("meta", {})
-            cursor = meta.get("next_cursor", "")
-            has_more = bool(cursor)
-
-            # Apply max_papers limit if specified
-            if max_papers and len(all_papers) >= max_papers:
-                all_papers = all_papers[:max_papers]
-                has_more = False
-
-            # Progress indicator
-            print(f"   Fetched {len(all_papers)} papers so far...")
+    total = first.get("meta", {}).get("count", 0)
+    if max_papers:
+        total = min(total, max_papers)
+
+    pages = [first.get("results", [])]
+    if total > OPENALEX_PAGE_LIMIT:
+        # Page numbers stop at 10,000 results; cursor paging has no cap but
+        # each request needs the previous one's cursor, so walk it serially
+        pages = []
+        fetched = 0
+        cursor = "*"
+        while cursor and fetched < total:
+            try:
+                data = await _fetch_json(session, f"{base_url}&cursor={quote(cursor)}")
+            except Exception as e:
+                print(f"⚠️  Error fetching papers after {fetched} results: {e}")
+                break
+            results = data.get("results", [])
+            if not results:
+                break
+            pages.append(results)
+            fetched += len(results)
+            cursor = data.get("meta", {}).get("next_cursor")
+    else:
+        last_page = (total + batch_size - 1) // batch_size
+        if last_page > 1:
+            pages += await asyncio.gather(*(fetch_page(page) for page in range(2, last_page + 1)))
 
-        except Exception as e:
-            print(f"⚠️  Error fetching papers: {e}")
-            break
+    # Citation counts can change between concurrent page requests and shift a
+    # work across a page boundary, so drop repeats by OpenAlex ID
+    all_papers = []
+    seen_ids = set()
+    for page in pages:
+        for item in page:
+            work_id = item.get("id")
+            if work_id in seen_ids:
+                continue
+            seen_ids.add(work_id)
+            all_papers.append(parse_openalex_work(item, author_id))
+    if max_papers:
+        all_papers = all_papers[:max_papers]
 
     print(f"✅ Total papers fetched: {len(all_papers)}")
     return all_papers
 
+
+def fetch_all_openalex_papers(author_id: str, batch_size: int = 100, max_papers: Optional[int] = None):
+    """Fetch all papers for a specific author ID with co-author information."""
+    return asyncio.run(fetch_all_openalex_papers_async(author_id, batch_size, max_papers))
+
 # -----------------------------
 # Unpaywall/Open Access Fetching
 # -----------------------------
@@ -694,7 +1326,7 @@ async def fetch_unpaywall(session, doi: str) -> Optional[str]:
             if resp.status != 200:
                 return None
 
-            data = await resp.json()
+            data = orjson.loads(await resp.read())
 
             # Check if open access version is available
             if data.get("oa_status") in ["green", "gold", "hybrid"]:
@@ -703,10 +1335,10 @@ async def fetch_unpaywall(session, doi: str) -> Optional[str]:
                     pdf_url = oa_location.get("url_for_pdf")
                     if pdf_url:
                         # Download the PDF
-                        async with session.get(pdf_url) as pdf_resp:
+                        async with session.get(pdf_url, timeout=PDF_DOWNLOAD_TIMEOUT) as pdf_resp:
                             if pdf_resp.status == 200:
-                                pdf_data = await pdf_resp.read()
-                                text = extract_text_from_pdf(pdf_data)
+                                pdf_data = await read_pdf_body(pdf_resp)
+                                text = await extract_text_from_pdf_async(pdf_data) if pdf_data else None
                                 if text:
                                     return text
     except Exception as e:
@@ -728,7 +1360,7 @@ async def fetch_crossref_data(session, doi: str) -> Dict:
             if resp.status != 200:
                 return {}
 
-            data = await resp.json()
+            data = orjson.loads(await resp.read())
             message = data.get("message", {})
 
             # Safely extract fields with proper checks
@@ -762,12 +1394,12 @@ async def fetch_arxiv_pdf(session, arxiv_id: str) -> Optional[str]:
 
     try:
         pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
-        async with session.get(pdf_url) as resp:
+        async with session.get(pdf_url, timeout=PDF_DOWNLOAD_TIMEOUT) as resp:
             if resp.status != 200:
                 return None
 
-            pdf_data = await resp.read()
-            text = extract_text_from_pdf(pdf_data)
+            pdf_data = await read_pdf_body(resp)
+            text = await extract_text_from_pdf_async(pdf_data) if pdf_data else None
             if text:
                 return text
 
@@ -776,6 +1408,26 @@ async def fetch_arxiv_pdf(session, arxiv_id: str) -> Optional[str]:
 
     return None
 
+# lxml's C parser when available, stdlib otherwise
+try:
+    from lxml.etree import iterparse as xml_iterparse
+except ImportError:
+    xml_iterparse = ET.iterparse
+
+ATOM_ENTRY = "{http://www.w3.org/2005/Atom}entry"
+ATOM_SUMMARY = "{http://www.w3.org/2005/Atom}summary"
+
+
+def extract_arxiv_summary(xml_data: bytes) -> Optional[str]:
+    """Stream-parse an arXiv Atom response and stop at the first entry's summary."""
+    in_entry = False
+    for event, elem in xml_iterparse(io.BytesIO(xml_data), events=("start", "end")):
+        if elem.tag == ATOM_ENTRY:
+            in_entry = event == "start"
+        elif in_entry and event == "end" and elem.tag == ATOM_SUMMARY:
+            return elem.text.strip() if elem.text else None
+    return None
+
 async def fetch_arxiv_fulltext(session, arxiv_id: str) -> Optional[str]:
     """Fetch full text from arXiv, trying PDF first then falling back to abstract."""
     if not arxiv_id:
@@ -793,16 +1445,9 @@ async def fetch_arxiv_fulltext(session, arxiv_id: str) -> Optional[str]:
             if resp.status != 200:
                 return None
 
-            xml_content = await resp.text()
-            root = ET.fromstring(xml_content)
-
-            ns = {'atom': 'http://www.w3.org/2005/Atom'}
-            entry = root.find('atom:entry', ns)
-
-            if entry is not None:
-                summary = entry.find('atom:summary', ns)
-                if summary is not None and summary.text:
-                    return summary.text.strip()
+            summary = extract_arxiv_summary(await resp.read())
+            if summary:
+                return summary
     except Exception as e:
         print(f"⚠️  arXiv fetch failed for {arxiv_id}: {e}")
 
@@ -811,15 +1456,63 @@ async def fetch_arxiv_fulltext(session, arxiv_id: str) -> Optional[str]:
 # -----------------------------
 # Semantic Scholar Fetching
 # -----------------------------
+# Semantic Scholar throttles bursts with 429s, so requests are capped per
+# event loop and throttled responses are retried with backoff
+SEMANTIC_MAX_CONCURRENT = int(os.environ.get("SEMANTIC_MAX_CONCURRENT", "5"))
+SEMANTIC_MAX_RETRIES = 4
+SEMANTIC_MAX_RETRY_WAIT = 30.0
+_semantic_semaphores: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+
+def _semantic_semaphore() -> asyncio.Semaphore:
+    """Return the Semantic Scholar concurrency cap for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _semantic_semaphores.get(loop)
+    if semaphore is None:
+        # The CLI runs a fresh loop per asyncio.run; drop caps of closed loops
+        for old_loop in [l for l in _semantic_semaphores if l.is_closed()]:
+            del _semantic_semaphores[old_loop]
+        semaphore = _semantic_semaphores[loop] = asyncio.Semaphore(SEMANTIC_MAX_CONCURRENT)
+    return semaphore
+
+
+async def semantic_request(session, method: str, url: str, **kwargs) -> Optional[bytes]:
+    """Send a Semantic Scholar request, retrying 429/503 and connection errors.
+
+    Waits honor Retry-After when given (capped at 30s), else back off exponentially
+    (1, 2, 4s) with jitter. Returns the body on 200, otherwise None.
+    """
+    for attempt in range(SEMANTIC_MAX_RETRIES):
+        retry_after = None
+        try:
+            async with _semantic_semaphore():
+                async with session.request(method, url, **kwargs) as resp:
+                    if resp.status == 200:
+                        return await resp.read()
+                    if resp.status not in (429, 503):
+                        return None
+                    retry_after = resp.headers.get("Retry-After")
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            pass
+        if attempt == SEMANTIC_MAX_RETRIES - 1:
+            break
+        try:
+            wait_time = min(float(retry_after), SEMANTIC_MAX_RETRY_WAIT)
+        except (TypeError, ValueError):
+            wait_time = 2 ** attempt + random.random()
+        # Sleep outside the semaphore so other requests keep the slot busy
+        await asyncio.sleep(wait_time)
+    return None
+
+
 async def fetch_semantic_data(session, title: str) -> Dict:
     """Fetch abstract and TL;DR from Semantic Scholar."""
     try:
         search_url = "https://api.semanticscholar.org/graph/v1/paper/search"
         params = {"query": title, "limit": 1, "fields": "title,abstract,tldr"}
-        async with session.get(search_url, params=params) as resp:
-            if resp.status != 200:
-                return {}
-            data = await resp.json()
+        body = await semantic_request(session, "GET", search_url, params=params)
+        if body:
+            data = orjson.loads(body)
             papers = data.get("data", [])
             if papers:
                 paper = papers[0]
@@ -831,113 +1524,205 @@ async def fetch_semantic_data(session, title: str) -> Dict:
         pass
     return {}
 
-# -----------------------------
-# Enhanced Content Enrichment with Deduplication
-# -----------------------------
-async def enrich_papers_with_content(papers: List[dict], max_concurrent: int = 5) -> List[dict]:
-    """Enrich papers with full text from multiple sources with deduplication."""
-    async with aiohttp.ClientSession() as session:
-        enriched_papers = []
 
-        for i in range(0, len(papers), max_concurrent):
-            batch = papers[i:i+max_concurrent]
+# The batch endpoint accepts at most 500 IDs per request
+SEMANTIC_BATCH_SIZE = 500
 
-            # Create tasks for all data sources
-            tasks = []
 
-            for p in batch:
-                # arXiv
-                tasks.append(fetch_arxiv_fulltext(session, p.get("arxiv_id")))
+async def fetch_semantic_data_batch(session, dois: List[str]) -> Dict[str, Dict]:
+    """Look up many papers by DOI in Semantic Scholar with one POST per 500 IDs.
 
-                # Semantic Scholar
-                tasks.append(fetch_semantic_data(session, p["title"]))
-
-                # Unpaywall (if DOI available)
-                tasks.append(fetch_unpaywall(session, p.get("doi")))
-
-                # Crossref (if DOI available)
-                tasks.append(fetch_crossref_data(session, p.get("doi")))
-
-            # Execute all tasks
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Process results for each paper
-            for j, paper in enumerate(batch):
-                content_sources = []  # List of (content, source) tuples
-
-                # arXiv result
-                arxiv_result = results[j*4]
-                if isinstance(arxiv_result, str) and arxiv_result:
-                    source_type = "arXiv PDF" if len(arxiv_result) > 1000 else "arXiv Abstract"
-                    content_sources.append((arxiv_result, source_type))
-
-                # Semantic Scholar result
-                ss_result = results[j*4 + 1]
-                if isinstance(ss_result, dict):
-                    if ss_result.get("abstract"):
-                        content_sources.append((ss_result["abstract"], "Semantic Scholar"))
-                    if ss_result.get("tldr"):
-                        tldr_text = f"Summary: {ss_result['tldr']}"
-                        content_sources.append((tldr_text, "Semantic Scholar TL;DR"))
-                        paper["tldr"] = ss_result["tldr"]
-
-                # Unpaywall result
-                unpaywall_result = results[j*4 + 2]
-                if isinstance(unpaywall_result, str) and unpaywall_result:
-                    content_sources.append((unpaywall_result, "Unpaywall OA"))
-
-                # Crossref result
-                crossref_result = results[j*4 + 3]
-                if isinstance(crossref_result, dict):
-                    if crossref_result.get("abstract"):
-                        content_sources.append((crossref_result["abstract"], "Crossref"))
+    Returns {doi.lower(): {"abstract", "tldr"}} for the papers that were
+    found; DOIs missing from the result are left to the per-title search.
+    """
+    results: Dict[str, Dict] = {}
+    url = "https://api.semanticscholar.org/graph/v1/paper/batch"
+    for start in range(0, len(dois), SEMANTIC_BATCH_SIZE):
+        chunk = dois[start:start + SEMANTIC_BATCH_SIZE]
+        body = await semantic_request(session, "POST", url, params={"fields": "abstract,tldr"},
+                                      data=orjson.dumps({"ids": [f"DOI:{d}" for d in chunk]}),
+                                      headers={"Content-Type": "application/json"})
+        try:
+            data = orjson.loads(body) if body else []
+        except orjson.JSONDecodeError:
+            continue
+        # Results come back in request order, with null for unknown IDs
+        for doi, paper in zip(chunk, data):
+            if paper:
+                results[doi.lower()] = {
+                    "abstract": paper.get("abstract") or "",
+                    "tldr": (paper.get("tldr") or {}).get("text", "")
+                }
+    return results
 
-                # Add OpenAlex abstract
-                if paper["abstract"]:
-                    content_sources.append((paper["abstract"], "OpenAlex"))
+# -----------------------------
+# Enhanced Content Enrichment with Deduplication
+# -----------------------------
+async def enrich_paper(session, paper: dict, ss_batch: Optional[asyncio.Future] = None) -> dict:
+    """Fetch all content sources for one paper, deduplicate them and merge into the paper.
 
-                # Deduplicate content
-                unique_content = deduplicate_content(content_sources)
+    `ss_batch` is an in-flight fetch_semantic_data_batch lookup; papers it
+    resolves skip the per-title Semantic Scholar search.
+    """
+    async def semantic_data() -> Dict:
+        if ss_batch is not None and paper.get("doi"):
+            found = (await ss_batch).get(paper["doi"].lower())
+            if found is not None:
+                return found
+        return await fetch_semantic_data(session, paper["title"])
+
+    arxiv_result, ss_result, unpaywall_result, crossref_result = await asyncio.gather(
+        fetch_arxiv_fulltext(session, paper.get("arxiv_id")),
+        semantic_data(),
+        fetch_unpaywall(session, paper.get("doi")),
+        fetch_crossref_data(session, paper.get("doi")),
+        return_exceptions=True,
+    )
+
+    content_sources = []  # List of (content, source) tuples
+
+    # arXiv result
+    if isinstance(arxiv_result, str) and arxiv_result:
+        source_type = "arXiv PDF" if len(arxiv_result) > 1000 else "arXiv Abstract"
+        content_sources.append((arxiv_result, source_type))
+
+    # Semantic Scholar result
+    if isinstance(ss_result, dict):
+        if ss_result.get("abstract"):
+            content_sources.append((ss_result["abstract"], "Semantic Scholar"))
+        if ss_result.get("tldr"):
+            tldr_text = f"Summary: {ss_result['tldr']}"
+            content_sources.append((tldr_text, "Semantic Scholar TL;DR"))
+            paper["tldr"] = ss_result["tldr"]
+
+    # Unpaywall result
+    if isinstance(unpaywall_result, str) and unpaywall_result:
+        content_sources.append((unpaywall_result, "Unpaywall OA"))
+
+    # Crossref result
+    if isinstance(crossref_result, dict):
+        if crossref_result.get("abstract"):
+            content_sources.append((crossref_result["abstract"], "Crossref"))
+
+    # Add OpenAlex abstract
+    if paper["abstract"]:
+        content_sources.append((paper["abstract"], "OpenAlex"))
+
+    # Deduplicate content
+    unique_content = deduplicate_content(content_sources)
+
+    # Combine unique content
+    combined_content = []
+    sources = []
+    for content, source in unique_content:
+        combined_content.append(content)
+        sources.append(source)
+
+    paper["full_content"] = "\n\n".join(combined_content)
+    paper["has_fulltext"] = bool(combined_content)
+    paper["content_source"] = ", ".join(sources) if sources else "None"
+    paper["content_sources"] = sources  # Keep detailed source info
+
+    return paper
+
+
+async def enrich_papers_with_content(papers: List[dict], max_concurrent: int = 5,
+                                     session=None) -> List[dict]:
+    """Enrich papers with full text from multiple sources with deduplication.
+
+    Each paper is enriched independently, with at most `max_concurrent` papers
+    in flight, so one slow source only delays its own paper. Pass `session`
+    to reuse the connection pool that fetched the papers.
+    """
+    if session is None:
+        async with open_http_session() as session:
+            return await enrich_papers_with_content(papers, max_concurrent, session)
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+    processed = 0
+    # One batched Semantic Scholar lookup for every paper with a DOI runs
+    # alongside the per-paper fetches instead of one search per title
+    dois = list({p["doi"]: None for p in papers if p.get("doi")})
+    ss_batch = asyncio.ensure_future(fetch_semantic_data_batch(session, dois)) if dois else None
+
+    async def bounded_enrich(paper: dict) -> dict:
+        nonlocal processed
+        async with semaphore:
+            result = await enrich_paper(session, paper, ss_batch)
+        processed += 1
+        # Progress indicator
+        if processed % max_concurrent == 0 or processed == len(papers):
+            print(f"   Processed {processed}/{len(papers)} papers...")
+        return result
 
-                # Combine unique content
-                combined_content = []
-                sources = []
-                for content, source in unique_content:
-                    combined_content.append(content)
-                    sources.append(source)
+    try:
+        enriched_papers = await asyncio.gather(*(bounded_enrich(p) for p in papers))
+    finally:
+        if ss_batch is not None:
+            ss_batch.cancel()
+    return list(enriched_papers)
 
-                paper["full_content"] = "\n\n".join(combined_content)
-                paper["has_fulltext"] = bool(combined_content)
-                paper["content_source"] = ", ".join(sources) if sources else "None"
-                paper["content_sources"] = sources  # Keep detailed source info
 
-                enriched_papers.append(paper)
+async def fetch_and_enrich_papers(author_ids: List[str], max_papers: Optional[int] = None,
+                                  session=None) -> List[dict]:
+    """Fetch papers for one or more author profiles and enrich them over one shared session.
 
-            # Progress indicator
-            print(f"   Processed {min(i+max_concurrent, len(papers))}/{len(papers)} papers...")
+    Profiles are fetched concurrently; papers appearing under several
+    profiles are deduplicated by DOI or title before enrichment.
+    """
+    if session is None:
+        async with open_http_session() as session:
+            return await fetch_and_enrich_papers(author_ids, max_papers, session)
+
+    parts = await asyncio.gather(
+        *(fetch_all_openalex_papers_async(aid, max_papers=max_papers, session=session) for aid in author_ids),
+        return_exceptions=True,
+    )
+    papers = []
+    seen_keys = set()
+    for aid, part in zip(author_ids, parts):
+        if isinstance(part, Exception):
+            print(f"⚠️  Failed to fetch papers for {aid}: {part}")
+            continue
+        if len(author_ids) == 1:
+            papers = part
+            break
+        # Deduplicate merged profiles by DOI or title
+        for p in part:
+            key = p.get("doi") or normalize_title(p.get("title"))
+            if key and key not in seen_keys:
+                papers.append(p)
+                seen_keys.add(key)
 
-            # Small delay to avoid rate limiting
-            await asyncio.sleep(0.5)
+    if not papers:
+        return []
 
-    return enriched_papers
+    print("🔄 Enriching with content from multiple sources (with deduplication)...")
+    return await enrich_papers_with_content(papers, session=session)
 
 # -----------------------------
 # Rule-based Summary Fallback
 # -----------------------------
+_KEYWORD_RE = re.compile(r"\b[a-zA-Z]{5,}\b")
+_KEYWORD_STOPWORDS = frozenset({"based", "using", "paper", "approach", "method", "system", "systems",
+                                "research", "study", "results", "proposed", "present", "provide"})
+
 def rule_based_summary(author_name: str, papers: List[dict]) -> str:
     """Generate rule-based summary from paper content."""
-    all_text = " ".join([p.get("full_content", "") for p in papers])
-    words = re.findall(r"\b[a-zA-Z]{5,}\b", all_text.lower())
-    counter = Counter(words)
-
-    stopwords = {"based", "using", "paper", "approach", "method", "system", "systems", 
-                 "research", "study", "results", "proposed", "present", "provide"}
-    keywords = [w for w, _ in counter.most_common(20) if w not in stopwords][:10]
+    # Count per paper instead of joining all full texts into one large string;
+    # findall + Counter.update keep the per-word loop in C, and stopwords are
+    # removed once from the tally rather than tested per occurrence
+    counter = Counter()
+    total_citations = 0
+    for p in papers:
+        counter.update(_KEYWORD_RE.findall((p.get("full_content") or "").lower()))
+        total_citations += p.get("cited_by_count", 0)
+    for word in _KEYWORD_STOPWORDS:
+        counter.pop(word, None)
+    keywords = [w for w, _ in counter.most_common(10)]
 
     summary = f"{author_name} has published {len(papers)} papers. "
     summary += f"Main research areas include: {', '.join(keywords)}. "
-
-    total_citations = sum(p.get("cited_by_count", 0) for p in papers)
     summary += f"These papers have received {total_citations} citations in total."
 
     return summary
@@ -945,7 +1730,42 @@ def rule_based_summary(author_name: str, papers: List[dict]) -> str:
 # -----------------------------
 # LLM Summary Generation (with OpenAI fallback)
 # -----------------------------
-def generate_paper_summary(paper: dict, max_tokens: int = 800) -> str:
+# Content budget for one paper summary prompt (~1000 tokens at ~4 chars/token)
+PAPER_SUMMARY_CONTENT_CHARS = int(os.environ.get("PAPER_SUMMARY_CONTENT_CHARS", "4000"))
+
+
+def truncate_at_sentence(text: str, max_chars: int) -> str:
+    """Cut text to at most max_chars, ending on the last sentence boundary.
+
+    Falls back to the hard cut when the last boundary would drop more than
+    half of the budget (e.g. PDF text with little punctuation).
+    """
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars]
+    last_punc = max(cut.rfind('.'), cut.rfind('?'), cut.rfind('!'))
+    if last_punc >= max_chars // 2:
+        return cut[: last_punc + 1]
+    return cut
+
+# Static instructions shared by every paper summary prompt; the paper's
+# title and content follow, keeping the request prefix identical across papers
+PAPER_SUMMARY_PROMPT_HEADER = """
+You are an expert research summarizer. Read the content below and produce a detailed, clear
+summary of this research paper. Provide a multi-paragraph summary (approx. 250-600 words
+or up to the token limit) with the following labeled sections when applicable:
+
+- Background: One or two sentences putting the work in context.
+- Main contribution(s): Clearly state the novel idea(s) or contribution(s).
+- Methodology/Approach: Describe the methods, experimental setup or key algorithms.
+- Results/Findings: Summarize principal results, empirical numbers and comparisons.
+- Limitations/Assumptions: Any important constraints or caveats.
+- Implications/Impact: Why this matters and possible future directions.
+
+"""
+
+
+def generate_paper_summary(paper: dict, max_tokens: int = 800, cancel: Optional[threading.Event] = None) -> str:
     """Generate a summary for an individual paper.
 
     Behavior:
@@ -956,6 +1776,7 @@ def generate_paper_summary(paper: dict, max_tokens: int = 800) -> str:
       excerpt of the full content (keeps earlier fallback behaviour).
     - If there's no full text, return the full abstract (not truncated) so the
       user sees the complete author-provided summary.
+    - If `cancel` is set before the LLM call, return "" without calling it.
     """
     title = paper.get("title") or paper.get("display_name") or "Untitled"
     raw_content = paper.get("full_content", "") or paper.get("abstract", "")
@@ -966,29 +1787,17 @@ def generate_paper_summary(paper: dict, max_tokens: int = 800) -> str:
 
     # Use LLM for full-text papers: produce a richer, structured summary
     if paper.get("has_fulltext") and len(content) > 1000:
+        if cancel is not None and cancel.is_set():
+            return ""
         # Larger, explicit prompt asking for structured sections so the LLM
         # returns a thorough, useful summary rather than a short blurb.
-        prompt = f"""
-You are an expert research summarizer. Read the content below and produce a detailed, clear
-summary of this research paper. Provide a multi-paragraph summary (approx. 250-600 words
-or up to the token limit) with the following labeled sections when applicable:
-
-- Background: One or two sentences putting the work in context.
-- Main contribution(s): Clearly state the novel idea(s) or contribution(s).
-- Methodology/Approach: Describe the methods, experimental setup or key algorithms.
-- Results/Findings: Summarize principal results, empirical numbers and comparisons.
-- Limitations/Assumptions: Any important constraints or caveats.
-- Implications/Impact: Why this matters and possible future directions.
-
-Paper Title: {title}
+        prompt = PAPER_SUMMARY_PROMPT_HEADER + f"""Paper Title: {title}
 
 Content (truncated for prompt):
-{content[:4000]}
+{truncate_at_sentence(content, PAPER_SUMMARY_CONTENT_CHARS)}
 
 Write the summary now, using the labeled sections above. Keep it technical and precise.
 """
-        print("inside generate paper summary")
-
         # Try Groq first
         summary = ""
         try:
@@ -1010,7 +1819,7 @@ Write the summary now, using the labeled sections above. Keep it technical and p
             try:
                 summary_text = str(summary).strip()
                 # Remove repeated 'Summary:' headings if present
-                summary_text = re.sub(r'^\s*Summary\s*:\s*', '', summary_text, flags=re.I)
+                summary_text = _SUMMARY_HEADING_RE.sub('', summary_text)
                 # Sanitize any XML/HTML tags that may appear
                 summary_text = sanitize_text(summary_text)
                 # Trim trailing incomplete fragment to last full sentence
@@ -1028,137 +1837,212 @@ Write the summary now, using the labeled sections above. Keep it technical and p
     return sanitize_text(content)
 
 
-def classify_paper_domains(papers: List[dict], batch_size: int = 10) -> List[dict]:
+def summarize_papers(papers: List[dict], max_tokens: int = 800, max_concurrent: int = 8,
+                     cancel: Optional[threading.Event] = None) -> List[str]:
+    """Summarize several papers concurrently; results are in input order.
+
+    generate_paper_summary is I/O-bound on the LLM call, so a thread pool
+    overlaps the requests while Groq 429s are still retried with backoff.
+    Papers not yet sent to the LLM when `cancel` is set get an empty summary.
+    """
+    if not papers:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_concurrent, len(papers))) as executor:
+        return list(executor.map(lambda p: generate_paper_summary(p, max_tokens=max_tokens, cancel=cancel), papers))
+
+
+# Domain list (expand as needed) - this is the target taxonomy the LLM will use
+ALLOWED_DOMAINS = [
+    "machine learning", "deep learning", "natural language processing",
+    "computer vision", "edge computing", "cloud computing",
+    "distributed systems", "networking", "security", "IoT",
+    "optimization", "algorithms", "theory", "databases",
+    "software engineering", "human-computer interaction", "robotics",
+    "bioinformatics", "healthcare", "other"
+]
+
+# Static parts of the classification prompt; only the papers JSON varies per batch
+DOMAIN_PROMPT_HEADER = f"""You are a research paper classifier. Given papers (id, title, text), assign each to 1-2 domains from this list:
+{', '.join(ALLOWED_DOMAINS)}
+
+Return ONLY valid JSON array: [{{"id": <id>, "domains": ["domain1", "domain2"], "confidence": 0.0-1.0}}]
+
+Papers:
+"""
+DOMAIN_PROMPT_FOOTER = """
+
+Output JSON:"""
+
+
+def domain_cache_key(paper: dict) -> str:
+    """Stable domain-cache key for a paper: OpenAlex id > DOI > title-hash."""
+    return paper.get("openalex_id") or paper.get("doi") or xxhash.xxh3_128_hexdigest((paper.get("title","") or "").encode())
+
+
+# Batch packing for domain classification: papers are grouped until the
+# estimated prompt size reaches the budget, capped at `batch_size` papers
+CLASSIFY_PROMPT_TOKEN_BUDGET = 3000
+CLASSIFY_ITEM_OVERHEAD_TOKENS = 15   # JSON keys/punctuation per item
+CLASSIFY_OUTPUT_TOKENS_PER_PAPER = 40
+# Debounce domain-cache writes: flush after this many batches or seconds
+DOMAIN_CACHE_SAVE_EVERY_BATCHES = 4
+DOMAIN_CACHE_SAVE_INTERVAL = 5.0
+
+
+def classify_paper_domains(papers: List[dict], batch_size: int = 30, max_concurrent: int = 8) -> List[dict]:
     """Classify papers into domains using an LLM with caching.
 
     Implementation notes (high level, non-invasive comments):
-    - The function defines a small, fixed taxonomy (`allowed_domains`) that the
+    - The module defines a small, fixed taxonomy (`ALLOWED_DOMAINS`) that the
       LLM is constrained to choose from. This makes labels predictable and
       consistent with the UI.
-    - Papers are processed in batches (default 10) to reduce the number of LLM
-      calls and stay within rate limits. Each batch becomes one prompt to the
-      LLM asking for a JSON array of domain assignments.
-    - Before calling the LLM for a paper, we check a local cache stored in
-    `domain_cache.json` (loaded via `load_domain_cache()`). Cached results
+    - Uncached papers are packed into batches by estimated prompt tokens
+      (`CLASSIFY_PROMPT_TOKEN_BUDGET`, at most `batch_size` papers) to reduce
+      the number of LLM calls. Each batch becomes one prompt to the LLM asking for a JSON array
+      of domain assignments; up to `max_concurrent` prompts are in flight at
+      once, with 429s handled by the backoff in `generate_with_groq`.
+    - Papers that already have `domains` are skipped. Before calling the LLM
+    for a paper, we check a local cache stored in
+    `domain_cache.sqlite` (loaded via `load_domain_cache()`). Cached results
     are applied immediately and skip the LLM call for that paper.
     - Cache key selection: prefer `openalex_id` (most stable), else DOI, else
-      MD5(title). This keeps the cache stable across runs and avoids
-      reclassification of unchanged works.
+      an xxh3-128 hash of the title (see `domain_cache_key`). This keeps the
+      cache stable across runs and avoids reclassification of unchanged works.
     - For LLM input we use the paper `title` and a truncated `abstract` (first
       ~500 chars). This provides context while keeping prompts compact.
     - The prompt requests 1-2 domains and a confidence value per paper, and the
     code expects strictly parseable JSON in response.
     - After a successful LLM response, the function assigns `domains` and
-    `domain_confidence` to each paper, updates the cache, and persists it to
-    disk after each batch (so progress isn't lost on interruption).
+    `domain_confidence` to each paper, updates the cache, and persists new
+    entries every few batches and once more on exit (so progress isn't lost
+    on interruption).
     - If the LLM call fails for a batch, the function falls back to assigning
     the domain `"other"` to uncached items to keep processing moving.
 
-    The block below is the original implementation with inline comments that
-    explain each step; no behavior is changed.
+    The block below has inline comments that explain each step.
     """
 
-    # Domain list (expand as needed) - this is the target taxonomy the LLM will use
-    allowed_domains = [
-        "machine learning", "deep learning", "natural language processing",
-        "computer vision", "edge computing", "cloud computing", 
-        "distributed systems", "networking", "security", "IoT",
-        "optimization", "algorithms", "theory", "databases",
-        "software engineering", "human-computer interaction", "robotics",
-        "bioinformatics", "healthcare", "other"
-    ]
-
     # Informational log for the user (shows which cache file will be used)
-    print(f"🏷️  Classifying {len(papers)} papers into domains using LLM... (cache: {DOMAIN_CACHE_FILE})")
+    print(f"🏷️  Classifying {len(papers)} papers into domains using LLM... (cache: {DOMAIN_CACHE_DB})")
 
     # Load persistent domain cache (avoids repeated LLM calls)
     cache = load_domain_cache()
 
-    # Process papers in batches to limit number of LLM calls
-    for i in range(0, len(papers), batch_size):
-        batch = papers[i:i+batch_size]
-
-        # items: list of dicts that will be sent to the LLM for classification
-        # abs_indices: parallel list of (absolute_index, cache_key) for mapping results back
-        items = []
-        abs_indices = []
-        for j, p in enumerate(batch):
-            abs_idx = i + j
-            # Choose a stable cache key: OpenAlex id > DOI > title-hash
-            key = p.get("openalex_id") or p.get("doi") or hashlib.md5((p.get("title","") or "").encode()).hexdigest()
-
-            if key in cache:
-                # If classification exists in cache, apply it and skip LLM
-                try:
-                    papers[abs_idx]["domains"] = cache[key].get("domains", ["other"])[:2]
-                    papers[abs_idx]["domain_confidence"] = cache[key].get("confidence", 0.0)
-                except Exception:
-                    # Safety net: on any cache parse error, assign 'other'
-                    papers[abs_idx]["domains"] = ["other"]
-                continue
-
-            # Prepare minimal context for LLM: title + short abstract slice
-            title = p.get("title", "")
-            abstract = p.get("abstract", "")[:500]
-            items.append({"id": abs_idx, "title": title, "text": abstract})
-            abs_indices.append((abs_idx, key))
-
-        # If all papers in this batch were cached, skip the LLM call
-        if not items:
-            print(f"   Skipped batch {i//batch_size + 1}: all cached")
+    # First sweep: apply cached labels and collect only the papers that still
+    # need the LLM; papers that already carry domains are left untouched
+    todo = []  # list of (absolute_index, cache_key)
+    for abs_idx, p in enumerate(papers):
+        if p.get("domains"):
             continue
-
-        # Build a compact JSON snippet for the prompt so the LLM receives structured input
-        items_json = json.dumps(items, indent=2)
-        prompt = f"""You are a research paper classifier. Given papers (id, title, text), assign each to 1-2 domains from this list:
-{', '.join(allowed_domains)}
-
-Return ONLY valid JSON array: [{{"id": <id>, "domains": ["domain1", "domain2"], "confidence": 0.0-1.0}}]
-
-Papers:
-{items_json}
-
-Output JSON:"""
-
-        try:
-            # Call the LLM (with retries handled inside generate_with_groq)
-            response = generate_with_groq(prompt, model=GROQ_MODEL, max_tokens=800, temperature=0.1)
-            result = json.loads(response.strip())
-
-            # Map LLM response back to paper objects and update the cache
-            for item in result:
-                paper_idx = item.get("id", -1)
-                domains = item.get("domains", ["other"])[:2]
-                confidence = item.get("confidence", 0.0)
-                if 0 <= paper_idx < len(papers):
-                    papers[paper_idx]["domains"] = domains
-                    papers[paper_idx]["domain_confidence"] = confidence
-
-                    # Update cache using the corresponding key for this absolute index
-                    for abs_idx, key in abs_indices:
-                        if abs_idx == paper_idx:
-                            cache[key] = {"domains": domains, "confidence": confidence}
-                            break
-
-        except Exception as e:
-            # On any failure (network, parse error, rate limit after retries), mark uncached items as 'other'
-            print(f"⚠️  Domain classification failed for batch {i//batch_size + 1}: {e}")
-            for abs_idx, key in abs_indices:
-                if "domains" not in papers[abs_idx]:
-                    papers[abs_idx]["domains"] = ["other"]
-                    cache[key] = {"domains": ["other"], "confidence": 0.0}
-
-        # Persist cache after each batch so work isn't lost on interruption
+        key = domain_cache_key(p)
+        cached = cache.get(key)
+        if cached is None:
+            todo.append((abs_idx, key))
+            continue
+        # If classification exists in cache, apply it and skip LLM
         try:
-            save_domain_cache(cache)
+            p["domains"] = cached.get("domains", ["other"])[:2]
+            p["domain_confidence"] = cached.get("confidence", 0.0)
         except Exception:
-            pass
+            # Safety net: on any cache parse error, assign 'other'
+            p["domains"] = ["other"]
+
+    if len(todo) < len(papers):
+        print(f"   {len(papers) - len(todo)}/{len(papers)} papers already classified")
+    if not todo:
+        return papers
+
+    # Pack the remaining papers into batches by estimated prompt tokens
+    # (~4 chars/token), at most `batch_size` papers each
+    batches = []  # list of (items, abs_key_by_idx)
+    # items: list of dicts that will be sent to the LLM for classification
+    # abs_key_by_idx: absolute_index -> cache_key, for mapping results back
+    items = []
+    abs_key_by_idx: Dict[int, str] = {}
+    batch_tokens = 0
+    for abs_idx, key in todo:
+        p = papers[abs_idx]
+        # Prepare minimal context for LLM: title + short abstract slice
+        title = p.get("title", "")
+        abstract = p.get("abstract", "")[:500]
+        item_tokens = (len(title) + len(abstract)) // 4 + CLASSIFY_ITEM_OVERHEAD_TOKENS
+
+        # Flush the current batch when the next paper would overflow it
+        if items and (batch_tokens + item_tokens > CLASSIFY_PROMPT_TOKEN_BUDGET or len(items) >= batch_size):
+            batches.append((items, abs_key_by_idx))
+            items, abs_key_by_idx, batch_tokens = [], {}, 0
+
+        items.append({"id": abs_idx, "title": title, "text": abstract})
+        abs_key_by_idx[abs_idx] = key
+        batch_tokens += item_tokens
+
+    if items:
+        batches.append((items, abs_key_by_idx))
+
+    # Each job is (batch_number, abs_key_by_idx, prompt, paper_count)
+    jobs = []
+    for batch_no, (items, abs_key_by_idx) in enumerate(batches, 1):
+        # Compact JSON (no indentation) so the LLM receives structured input
+        # without paying for whitespace tokens
+        prompt = DOMAIN_PROMPT_HEADER + orjson.dumps(items).decode() + DOMAIN_PROMPT_FOOTER
+        jobs.append((batch_no, abs_key_by_idx, prompt, len(items)))
+
+    def classify_batch(prompt: str, paper_count: int):
+        # Size the completion so a full batch's JSON array is never truncated;
+        # retries and 429 backoff are handled inside generate_with_groq
+        max_tokens = max(800, paper_count * CLASSIFY_OUTPUT_TOKENS_PER_PAPER)
+        response = generate_with_groq(prompt, model=GROQ_CLASSIFY_MODEL, max_tokens=max_tokens, temperature=0.1)
+        return orjson.loads(response.strip())
+
+    # Second pass: send all batch prompts concurrently, bounded by max_concurrent.
+    # New cache entries are flushed every few batches/seconds and once at the end.
+    pending_entries = {}
+    batches_since_save = 0
+    last_save = time.monotonic()
+    try:
+        with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+            futures = {executor.submit(classify_batch, prompt, paper_count): (batch_no, abs_key_by_idx)
+                       for batch_no, abs_key_by_idx, prompt, paper_count in jobs}
 
-        print(f"   Classified {min(i+batch_size, len(papers))}/{len(papers)} papers...")
+            # Apply each batch as soon as it finishes rather than in submission order
+            for done, future in enumerate(as_completed(futures), 1):
+                batch_no, abs_key_by_idx = futures[future]
+                try:
+                    result = future.result()
+
+                    # Map LLM response back to paper objects and update the cache
+                    for item in result:
+                        paper_idx = item.get("id", -1)
+                        domains = item.get("domains", ["other"])[:2]
+                        confidence = item.get("confidence", 0.0)
+                        if 0 <= paper_idx < len(papers):
+                            papers[paper_idx]["domains"] = domains
+                            papers[paper_idx]["domain_confidence"] = confidence
+
+                            # Update cache using the corresponding key for this absolute index
+                            key = abs_key_by_idx.get(paper_idx)
+                            if key is not None:
+                                cache[key] = pending_entries[key] = {"domains": domains, "confidence": confidence}
 
-        # Small delay between batches to be polite to the LLM provider and avoid rate limiting
-        if i + batch_size < len(papers):
-            time.sleep(1)
+                except Exception as e:
+                    # On any failure (network, parse error, rate limit after retries), mark uncached items as 'other'
+                    print(f"⚠️  Domain classification failed for batch {batch_no}: {e}")
+                    for abs_idx, key in abs_key_by_idx.items():
+                        if "domains" not in papers[abs_idx]:
+                            papers[abs_idx]["domains"] = ["other"]
+                            cache[key] = pending_entries[key] = {"domains": ["other"], "confidence": 0.0}
+
+                print(f"   Classified {done}/{len(jobs)} LLM batches...")
+
+                batches_since_save += 1
+                if batches_since_save >= DOMAIN_CACHE_SAVE_EVERY_BATCHES or time.monotonic() - last_save > DOMAIN_CACHE_SAVE_INTERVAL:
+                    save_domain_cache(pending_entries)
+                    pending_entries = {}
+                    batches_since_save = 0
+                    last_save = time.monotonic()
+    finally:
+        # Persist whatever is left so work isn't lost on interruption
+        save_domain_cache(pending_entries)
 
     return papers
 
@@ -1174,36 +2058,76 @@ def compute_publication_stats(papers: List[dict], author_info: dict) -> dict:
         "collaboration_stats": {}
     }
 
-    # Yearly distribution
-    years = [p.get("year") for p in papers if isinstance(p.get("year"), int)]
-    if years:
-        min_year = min(years)
-        max_year = max(years)
-        stats["years_active"] = max_year - min_year + 1
-        stats["publication_velocity"] = len(papers) / stats["years_active"] if stats["years_active"] > 0 else 0
-
-        for year in years:
-            stats["papers_per_year"][year] = stats["papers_per_year"].get(year, 0) + 1
-
-    # Collaboration patterns
+    # Single pass over papers: yearly distribution and collaboration patterns
+    year_counts = Counter()
     coauthor_counts = Counter()
+    total_coauthor_slots = 0
     for paper in papers:
+        year = paper.get("year")
+        if isinstance(year, int):
+            year_counts[year] += 1
         coauthors = paper.get("coauthors", [])
-        for ca in coauthors:
-            coauthor_counts[ca["name"]] += 1
+        total_coauthor_slots += len(coauthors)
+        coauthor_counts.update(ca["name"] for ca in coauthors)
+
+    # Yearly distribution
+    if year_counts:
+        min_year = min(year_counts)
+        max_year = max(year_counts)
+        stats["years_active"] = max_year - min_year + 1
+        stats["publication_velocity"] = len(papers) / stats["years_active"] if stats["years_active"] > 0 else 0
+        stats["papers_per_year"] = dict(year_counts)
 
     # Top 10 collaborators
     stats["top_collaborators"] = coauthor_counts.most_common(10)
     stats["collaboration_stats"] = {
         "total_coauthors": len(coauthor_counts),
-        "avg_coauthors_per_paper": sum(len(p.get("coauthors", [])) for p in papers) / len(papers) if papers else 0
+        "avg_coauthors_per_paper": total_coauthor_slots / len(papers) if papers else 0
     }
 
     return stats
 
 
-def generate_author_summary(author_name: str, author_info: dict, papers: List[dict]) -> str:
-    """Generate comprehensive author summary using advanced LLM."""
+# Total characters of paper content included in the author-summary prompt,
+# and the word-set Jaccard above which two snippets count as the same paper
+AUTHOR_SUMMARY_CONTENT_BUDGET = int(os.environ.get("AUTHOR_SUMMARY_CONTENT_BUDGET", "12000"))
+AUTHOR_SUMMARY_DUP_THRESHOLD = 0.6
+# Below this much paper content (or this few papers with any) an LLM summary
+# is mostly filler, so the rule-based summary is returned without a call
+AUTHOR_SUMMARY_MIN_CONTENT_CHARS = 2000
+AUTHOR_SUMMARY_MIN_CONTENT_PAPERS = 3
+
+# Fixed instructions lead the prompt and author-specific facts follow, so
+# every author summary request shares the same prefix for provider-side
+# prompt caching
+AUTHOR_SUMMARY_PROMPT_HEADER = """You are an expert research analyst. Analyze the research profile of the author described below.
+
+Based on the author metrics and top papers (with full content when available), write a comprehensive 3-4 paragraph research summary covering:
+
+1. **Main Research Areas**: Identify primary domains, methodologies, and theoretical frameworks
+2. **Key Contributions**: Highlight novel contributions, breakthrough findings, and impact
+3. **Research Evolution**: Note any evolution in research focus over time
+4. **Collaboration Patterns**: Comment on co-authorship and interdisciplinary work
+5. **Impact & Significance**: Assess the broader impact on the field
+
+"""
+
+# Author summaries are reused for as long as the Neo4j cache considers the
+# author fresh (STALE_DAYS in neo4j_repository). Together with the LLM_CACHE_DAYS
+# expiry on the prompt-keyed completion, a regeneration after the Neo4j entry
+# goes stale calls the LLM again. Keyed on the prompt header too, so editing
+# the instructions invalidates old summaries.
+AUTHOR_SUMMARY_CACHE_DAYS = int(os.environ.get("AUTHOR_SUMMARY_CACHE_DAYS", "15"))
+_AUTHOR_PROMPT_HASH = xxhash.xxh3_64_hexdigest(AUTHOR_SUMMARY_PROMPT_HEADER.encode())
+
+
+def generate_author_summary(author_name: str, author_info: dict, papers: List[dict],
+                            on_token: Optional[Callable[[str], None]] = None) -> str:
+    """Generate comprehensive author summary using advanced LLM.
+
+    If `on_token` is given, the Groq response is streamed and each chunk is
+    passed to it as it arrives; the full summary is still returned.
+    """
     # Prepare paper information - choose a mix of most-cited and most-recent
     # papers so the summary captures both impact and recent directions.
     sample_size = min(20, len(papers))
@@ -1211,31 +2135,66 @@ def generate_author_summary(author_name: str, author_info: dict, papers: List[di
     num_cited = min(max(5, sample_size * 60 // 100), sample_size)
     num_recent = sample_size - num_cited
 
-    cited_sorted = sorted(papers, key=lambda x: x.get("cited_by_count", 0), reverse=True)
-    recent_sorted = sorted(papers, key=lambda x: x.get("year") or 0, reverse=True)
-
-    selected = []
-    # Add top-cited
-    for p in cited_sorted:
-        if len(selected) >= num_cited:
-            break
-        selected.append(p)
+    # Only the leading entries of each ordering are needed, so partial
+    # selection replaces two full sorts
+    selected = heapq.nlargest(num_cited, papers, key=lambda x: x.get("cited_by_count", 0))
+    selected_ids = {id(p) for p in selected}
 
     # Add recent, avoiding duplicates
-    for p in recent_sorted:
+    for p in heapq.nlargest(sample_size, papers, key=lambda x: x.get("year") or 0):
         if len(selected) >= sample_size:
             break
-        if p in selected:
+        if id(p) in selected_ids:
             continue
         selected.append(p)
 
     top_papers = selected
 
+    content_chars = 0
+    papers_with_content = 0
+    for p in top_papers:
+        n = len(p.get("full_content") or "")
+        content_chars += n
+        papers_with_content += n > 0
+    if content_chars < AUTHOR_SUMMARY_MIN_CONTENT_CHARS or papers_with_content < AUTHOR_SUMMARY_MIN_CONTENT_PAPERS:
+        print(f"📝 Only {papers_with_content} paper(s) with {content_chars} chars of content; "
+              f"using rule-based summary instead of the LLM")
+        return rule_based_summary(author_name, papers)
+
+    affiliation_name = resolve_affiliation(author_info, "Unknown")
+
+    total_works = author_info.get("works_count", 0)
+    total_citations = author_info.get("cited_by_count", 0)
+    h_index = author_info.get("summary_stats", {}).get("h_index", 0)
+
+    # Reuse a previous summary of the same author profile and paper selection
+    summary_cache_key = "author-summary:" + hashlib.blake2b(orjson.dumps(
+        [GROQ_MODEL, OPENAI_MODEL, _AUTHOR_PROMPT_HASH, author_name, affiliation_name,
+         sorted(p.get("openalex_id") or p.get("title") or "" for p in top_papers), h_index]
+    ), digest_size=16).hexdigest()
+    cached_summary = llm_cache_get(summary_cache_key)
+    if cached_summary:
+        print("📦 Using cached author summary")
+        return cached_summary
+
+    # Share a fixed content budget across the selected papers (up to ~2000
+    # chars each) so the prompt size stays bounded for prolific authors
+    per_paper_chars = min(2000, AUTHOR_SUMMARY_CONTENT_BUDGET // max(1, len(top_papers)))
+
     papers_text = []
-    for i, p in enumerate(top_papers, 1):
-        # Use a longer snippet from full content if available to give LLM enough
-        # context for author-level synthesis (up to ~2000 chars per paper).
-        content = p.get("full_content", "")[:2000]
+    included_tokens = []  # word sets of included snippets, for near-duplicate checks
+    for p in top_papers:
+        content = (p.get("full_content") or "")[:per_paper_chars]
+
+        # Skip near-identical versions of an already included paper
+        # (e.g. the arXiv preprint and the published version)
+        tokens = frozenset(normalize_text(content).split())
+        if tokens and any(
+            len(tokens & seen) / len(tokens | seen) > AUTHOR_SUMMARY_DUP_THRESHOLD for seen in included_tokens
+        ):
+            continue
+        included_tokens.append(tokens)
+        i = len(papers_text) + 1
 
         # Format co-authors
         coauthors_str = ""
@@ -1256,35 +2215,13 @@ def generate_author_summary(author_name: str, author_info: dict, papers: List[di
 
     combined_text = "\n\n".join(papers_text)
 
-    # Get affiliation
-    affiliation_name = "Unknown"
-    last_institution = author_info.get("last_known_institution", {})
-    if last_institution:
-        affiliation_name = last_institution.get("display_name", "Unknown")
-    else:
-        institutions = author_info.get("last_known_institutions", [])
-        if institutions:
-            affiliation_name = institutions[0].get("display_name", "Unknown")
-
-    total_works = author_info.get("works_count", 0)
-    total_citations = author_info.get("cited_by_count", 0)
-    h_index = author_info.get("summary_stats", {}).get("h_index", 0)
-
-    prompt = f"""You are an expert research analyst. Analyze the research profile of {author_name}, affiliated with {affiliation_name}.
+    prompt = AUTHOR_SUMMARY_PROMPT_HEADER + f"""Author: {author_name}, affiliated with {affiliation_name}.
 
 Author Metrics:
 - Total Publications: {total_works}
 - Total Citations: {total_citations}
 - h-index: {h_index}
 
-Based on the following top papers (with full content when available), write a comprehensive 3-4 paragraph research summary covering:
-
-1. **Main Research Areas**: Identify primary domains, methodologies, and theoretical frameworks
-2. **Key Contributions**: Highlight novel contributions, breakthrough findings, and impact
-3. **Research Evolution**: Note any evolution in research focus over time
-4. **Collaboration Patterns**: Comment on co-authorship and interdisciplinary work
-5. **Impact & Significance**: Assess the broader impact on the field
-
 Top Papers:
 {combined_text}
 
@@ -1294,7 +2231,16 @@ Write a detailed, insightful summary of {author_name}'s research contributions:"
     summary = ""
     try:
         print(f"🤖 Generating summary with {GROQ_MODEL} via GroqCloud...")
-        summary = generate_with_groq(prompt, model=GROQ_MODEL, max_tokens=1024, temperature=0.2)
+        if on_token:
+            parts = []
+            for chunk in generate_with_groq_stream(prompt, model=GROQ_MODEL, max_tokens=1024, temperature=0.2):
+                on_token(chunk)
+                parts.append(chunk)
+            summary = "".join(parts)
+        else:
+            # One retry on timeout, then fall back rather than stacking slow
+            # attempts; rate limits keep the usual retry budget
+            summary = generate_with_groq(prompt, model=GROQ_MODEL, max_tokens=1024, temperature=0.2, max_timeouts=2)
     except Exception as e:
         print(f"⚠️  Groq call failed for author summary: {e}")
 
@@ -1310,109 +2256,108 @@ Write a detailed, insightful summary of {author_name}'s research contributions:"
         print("📝 Using rule-based summary instead...\n")
         return rule_based_summary(author_name, papers)
 
-    return str(summary).strip()
+    summary = str(summary).strip()
+    llm_cache_set(summary_cache_key, summary, expire=AUTHOR_SUMMARY_CACHE_DAYS * 86400)
+    return summary
 
 # -----------------------------
 # Main Function
 # -----------------------------
-def main():
-    groq_key = get_groq_api_key_interactive() 
-    if groq_key:
-        # For security, it's better to print a masked version of the key
-        masked_key = f"{groq_key[:4]}...{groq_key[-4:]}"
-        print(f"✅ DEBUG: GROQ API Key was found and loaded. Key: {groq_key}")
-        # If you absolutely MUST see the full key, uncomment the line below
-        # print(f"!!! INSECURE DEBUG: Full key is: {groq_key} !!!") 
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse CLI options; with none given the tool runs fully interactively."""
+    parser = argparse.ArgumentParser(description="Enhanced Author Profile System")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--author", help="author name to search for")
+    target.add_argument("--author-id", help="OpenAlex author ID (e.g. A5023888391)")
+    target.add_argument("--orcid", help="author ORCID (e.g. 0000-0002-1825-0097)")
+    target.add_argument("--batch-file", help="file with one author name or OpenAlex ID per line; implies --no-prompt")
+    parser.add_argument("--select", type=int, help="1-based candidate to pick when a name matches several authors")
+    parser.add_argument("--top", type=int, help="fetch only the N most-cited papers instead of all")
+    parser.add_argument("--no-prompt", action="store_true", help="never prompt; answer every question with its default")
+    return parser.parse_args(argv)
+
+
+def pick_candidate(authors: List[dict], author_name: str, select: Optional[int], prompt: bool) -> Optional[dict]:
+    """Choose one author from name-search results, prompting only when needed."""
+    if len(authors) == 1:
+        print(f"✅ Found: {authors[0].get('display_name', author_name)}")
+        return authors[0]
+    if select or not prompt:
+        author_info = authors[min(max(select or 1, 1), len(authors)) - 1]
     else:
-        print("❌ DEBUG: GROQ API Key was NOT found.")
-    print("--- [END DEBUGGING] ---\n")
-    print("🔍 Enhanced Author Profile System with Multiple Data Sources and Deduplication")
-    print("Data sources: OpenAlex, arXiv, Semantic Scholar, Unpaywall, Crossref")
-    print("Features: Automatic duplicate removal from multiple sources")
-    print("Note: For PDF extraction, install: pip install PyPDF2 pdfplumber")
-    print()
+        author_info = display_author_candidates(authors)
+        if not author_info:
+            print("\n👋 Exiting...")
+            return None
+    print(f"\n✅ Selected: {author_info.get('display_name', author_name)}")
+    return author_info
 
-    # Safe input helper to allow non-interactive runs (returns default on EOF)
-    def safe_input(prompt: str, default: str = "") -> str:
-        try:
-            return input(prompt)
-        except EOFError:
-            return default
 
-    # Step 0: Ask search method
-    search_method = safe_input("Search by (1) Name or (2) ORCID? Enter 1 or 2: ", "1").strip()
+def select_author(args: argparse.Namespace, safe_input: Callable[[str, str], str]):
+    """Resolve the author to profile from CLI options, falling back to prompts.
+
+    Returns (author_info, candidates); candidates are the search results the
+    author was picked from and are used to merge profiles sharing an ORCID.
+    """
+    if args.author_id:
+        author_info = fetch_author_by_id(args.author_id)
+        if not author_info:
+            print("❌ No author found with that ID")
+            return None, []
+        print(f"✅ Found: {author_info.get('display_name', 'Unknown')}")
+        return author_info, [author_info]
 
-    author_info = None
+    orcid = args.orcid
+    if orcid is None and args.author is None:
+        # Step 0: Ask search method
+        search_method = safe_input("Search by (1) Name or (2) ORCID? Enter 1 or 2: ", "1").strip()
+        if search_method == "2":
+            orcid = safe_input("Enter ORCID (e.g., 0000-0002-1825-0097): ", "").strip()
 
-    if search_method == "2":
+    if orcid is not None:
         # ORCID search
-        orcid = safe_input("Enter ORCID (e.g., 0000-0002-1825-0097): ", "").strip()
         print(f"\n📋 Searching by ORCID: {orcid}")
         author_info = fetch_author_by_orcid(orcid)
-
         if not author_info:
             print("❌ No author found with that ORCID")
-            return
-
+            return None, []
         print(f"✅ Found: {author_info.get('display_name', 'Unknown')}")
-    else:
-        # Name search
-        author_name = safe_input("Enter author name: ", "").strip()
+        return author_info, [author_info]
 
-        # Step 1: Fetch author candidates
-        print(f"\n📋 Searching for: {author_name}")
-        authors = fetch_author_candidates(author_name)
+    # Name search
+    author_name = args.author if args.author is not None else safe_input("Enter author name: ", "").strip()
 
-        if not authors:
-            print("❌ No authors found in OpenAlex")
-            return
+    # Step 1: Fetch author candidates
+    print(f"\n📋 Searching for: {author_name}")
+    authors = fetch_author_candidates(author_name)
+    if not authors:
+        print("❌ No authors found in OpenAlex")
+        return None, []
+
+    # Step 2: Select author
+    return pick_candidate(authors, author_name, args.select, prompt=not args.no_prompt), authors
 
-        # Step 2: Select author
-        if len(authors) == 1:
-            print(f"✅ Found: {authors[0].get('display_name', author_name)}")
-            author_info = authors[0]
-        else:
-            author_info = display_author_candidates(authors)
-            if not author_info:
-                print("\n👋 Exiting...")
-                return
-            print(f"\n✅ Selected: {author_info.get('display_name', author_name)}")
 
+def merged_profile_ids(author_info: dict, candidates: List[dict]) -> List[str]:
+    """IDs of the selected profile plus other candidates with the same ORCID."""
     author_id = author_info["id"]
-    display_name = author_info.get("display_name", "Unknown")
-    # --- Merge multiple OpenAlex author profiles if same ORCID exists ---
+    profile_ids = [author_id]
     orcid = author_info.get("orcid")
     if orcid:
-        same_orcid_authors = [a for a in authors if a.get("orcid") == orcid and a.get("id") != author_id]
+        same_orcid_authors = [a for a in candidates if a.get("orcid") == orcid and a.get("id") != author_id]
         if same_orcid_authors:
             print(f"\n🔗 Found {len(same_orcid_authors)} other OpenAlex profile(s) with the same ORCID — merging papers...")
             # Include the selected author first
-            merged_author_ids = [author_id] + [a["id"] for a in same_orcid_authors]
-            all_papers = []
-            for idx, aid in enumerate(merged_author_ids, 1):
-                print(f"   Fetching papers from profile {idx}/{len(merged_author_ids)} ({aid})...")
-                try:
-                    papers_part = fetch_all_openalex_papers(aid)
-                    all_papers.extend(papers_part)
-                except Exception as e:
-                    print(f"⚠️  Failed to fetch papers for {aid}: {e}")
-
-            # Deduplicate by title or DOI
-            unique_papers = []
-            seen_keys = set()
-            for p in all_papers:
-                key = p.get("doi") or p.get("title", "").lower()
-                if key and key not in seen_keys:
-                    unique_papers.append(p)
-                    seen_keys.add(key)
-            papers = unique_papers
-            print(f"✅ Merged total of {len(papers)} unique papers from {len(merged_author_ids)} profiles.")
-        else:
-            # No other profiles with same ORCID
-            papers = fetch_all_openalex_papers(author_id)
-    else:
-        # No ORCID, just fetch selected author
-        papers = fetch_all_openalex_papers(author_id)
+            profile_ids += [a["id"] for a in same_orcid_authors]
+    return profile_ids
+
+
+def choose_max_papers(author_info: dict, args: argparse.Namespace,
+                      safe_input: Callable[[str, str], str]) -> Optional[int]:
+    """Return the paper limit from --top or the prompts; None fetches all papers."""
+    if args.top:
+        print(f"\n📚 Fetching top {args.top} papers with co-author information...")
+        return args.top
 
     # Note: works_count is from cached metadata and may differ slightly from actual fetch
     estimated_papers = author_info.get("works_count", 0)
@@ -1422,38 +2367,102 @@ def main():
     # the user presses Enter. If the user explicitly answers 'n', they can
     # supply a limit below.
     fetch_all_input = safe_input(f"\n📚 Fetch all papers (~{estimated_papers} estimated)? This may take a while. (Y/n): ", "y").strip()
+    if fetch_all_input.lower() != 'n':
+        return None
+
+    # If the user opts out of fetching all, default to the estimated
+    # number of works (so there is no hard-coded "20") and allow the
+    # user to override with an integer.
+    default_limit = estimated_papers or 20
+    max_papers = safe_input(f"How many papers to fetch? (default {default_limit}): ", str(default_limit)).strip()
     try:
-        fetch_all = fetch_all_input.lower() != 'n'
+        max_papers = int(max_papers) if max_papers else int(default_limit)
     except Exception:
-        fetch_all = True
+        max_papers = int(default_limit)
 
-    # Step 3: Fetch papers with co-authors
-    if fetch_all:
-        papers = fetch_all_openalex_papers(author_id)
-    else:
-        # If the user opts out of fetching all, default to the estimated
-        # number of works (so there is no hard-coded "20") and allow the
-        # user to override with an integer.
-        default_limit = estimated_papers or 20
-        max_papers = safe_input(f"How many papers to fetch? (default {default_limit}): ", str(default_limit)).strip()
-        try:
-            max_papers = int(max_papers) if max_papers else int(default_limit)
-        except Exception:
-            max_papers = int(default_limit)
+    print(f"\n📚 Fetching top {max_papers} papers with co-author information...")
+    return max_papers
 
-        print(f"\n📚 Fetching top {max_papers} papers with co-author information...")
-        papers = fetch_all_openalex_papers(author_id, max_papers=max_papers)
 
-    if not papers:
-        print("❌ No papers found for this author")
+_OPENALEX_AUTHOR_ID_RE = re.compile(r"^A\d+$")
+# Author summaries generated at once in batch mode (Groq pacing still applies)
+BATCH_SUMMARY_WORKERS = 4
+
+
+async def _fetch_batch_authors(entries: List[str], args: argparse.Namespace) -> List[tuple]:
+    """Resolve, fetch and enrich every batch entry concurrently over one session."""
+    async with open_http_session() as session:
+        # Entries given as OpenAlex IDs are looked up together in one request
+        id_entries = [e for e in entries if _OPENALEX_AUTHOR_ID_RE.match(e) or "openalex.org/" in e]
+        authors_by_id = await fetch_authors_by_ids_async(session, id_entries) if id_entries else {}
+
+        async def resolve(entry: str) -> tuple:
+            if entry in id_entries:
+                author_info = authors_by_id.get(entry.split('/')[-1])
+                if not author_info:
+                    print(f"⚠️  Author with ID '{entry}' not found.")
+                candidates = [author_info] if author_info else []
+            else:
+                try:
+                    candidates = await fetch_author_candidates_async(session, entry)
+                except Exception as e:
+                    print(f"⚠️  Author search failed for '{entry}': {e}")
+                    candidates = []
+                author_info = pick_candidate(candidates, entry, args.select, prompt=False) if candidates else None
+            if not author_info:
+                return None, []
+            profile_ids = merged_profile_ids(author_info, candidates)
+            return author_info, await fetch_and_enrich_papers(profile_ids, args.top, session)
+
+        return await asyncio.gather(*(resolve(entry) for entry in entries))
+
+
+def run_batch(args: argparse.Namespace, safe_input: Callable[[str, str], str]):
+    """Profile every author listed in args.batch_file.
+
+    Author lookups, paper fetching/enrichment and the author summaries run
+    concurrently across authors; reports are then printed one author at a time.
+    """
+    with open(args.batch_file, encoding="utf-8") as f:
+        entries = [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+    if not entries:
+        print("❌ No authors listed in the batch file")
         return
 
-    # Step 4: Enrich with full content from multiple sources
-    print("🔄 Enriching with content from multiple sources (with deduplication)...")
-    papers = asyncio.run(enrich_papers_with_content(papers))
+    print(f"📋 Processing {len(entries)} authors from {args.batch_file}...")
+    resolved = asyncio.run(_fetch_batch_authors(entries, args))
+
+    with ThreadPoolExecutor(max_workers=BATCH_SUMMARY_WORKERS) as pool:
+        summaries = [
+            pool.submit(generate_author_summary, author_info.get("display_name", "Unknown"), author_info, papers)
+            if author_info and papers else None
+            for author_info, papers in resolved
+        ]
+        for entry, (author_info, papers), summary in zip(entries, resolved, summaries):
+            print("\n" + "#" * 80)
+            print(f"# {entry}")
+            print("#" * 80)
+            if not author_info:
+                print("❌ No author found")
+            elif not papers:
+                print("❌ No papers found for this author")
+            else:
+                report_author(author_info, papers, safe_input, summary.result())
+
+
+def report_author(author_info: dict, papers: List[dict], safe_input: Callable[[str, str], str],
+                  summary: Optional[str] = None):
+    """Print the profile, statistics, research summary and paper listing for one author.
+
+    The research summary is generated (and streamed) here unless `summary`
+    is passed in already generated.
+    """
+    display_name = author_info.get("display_name", "Unknown")
+    # Sort once by citations (descending); the paper listing below relies on it
+    papers.sort(key=lambda x: x.get("cited_by_count", 0), reverse=True)
 
     # Count sources and duplicates removed
-    source_counts = {}
+    source_counts = Counter()
     fulltext_count = 0
 
     for p in papers:
@@ -1461,9 +2470,7 @@ def main():
             fulltext_count += 1
 
         # Count sources
-        if p.get("content_sources"):
-            for source in p["content_sources"]:
-                source_counts[source] = source_counts.get(source, 0) + 1
+        source_counts.update(p.get("content_sources") or ())
 
     print(f"✅ Found full text for {fulltext_count}/{len(papers)} papers")
     if source_counts:
@@ -1481,10 +2488,6 @@ def main():
     print("\n📊 Computing publication statistics...")
     pub_stats = compute_publication_stats(papers, author_info)
 
-    # Step 5: Generate LLM summary
-    print(f"\n🤖 Generating comprehensive research summary...")
-    summary = generate_author_summary(display_name, author_info, papers)
-
     # -----------------------------
     # Display Results
     # -----------------------------
@@ -1497,15 +2500,7 @@ def main():
     if orcid and orcid.startswith("https://orcid.org/"):
         orcid = orcid.replace("https://orcid.org/", "")
 
-    # Get affiliation
-    affiliation_name = "N/A"
-    last_institution = author_info.get("last_known_institution", {})
-    if last_institution:
-        affiliation_name = last_institution.get("display_name", "N/A")
-    else:
-        institutions = author_info.get("last_known_institutions", [])
-        if institutions:
-            affiliation_name = institutions[0].get("display_name", "N/A")
+    affiliation_name = resolve_affiliation(author_info)
 
     print(f"🆔 ORCID: {orcid}")
     print(f"📍 Affiliation: {affiliation_name}")
@@ -1519,7 +2514,7 @@ def main():
     print(f"Years Active: {pub_stats['years_active']}")
     print(f"Publication Velocity: {pub_stats['publication_velocity']:.2f} papers/year")
     print(f"\nPapers per Year:")
-    for year in sorted(pub_stats['papers_per_year'].keys(), reverse=True)[:10]:
+    for year in heapq.nlargest(10, pub_stats['papers_per_year']):
         count = pub_stats['papers_per_year'][year]
         print(f"  {year}: {count} papers")
 
@@ -1533,7 +2528,23 @@ def main():
     print("\n" + "=" * 80)
     print("🧠 RESEARCH SUMMARY")
     print("=" * 80)
-    print(summary)
+
+    # Step 5: Generate LLM summary, streaming it to the terminal as it arrives
+    if summary is None:
+        streamed = []
+
+        def print_chunk(chunk: str):
+            streamed.append(chunk)
+            print(chunk, end="", flush=True)
+
+        summary = generate_author_summary(display_name, author_info, papers, on_token=print_chunk)
+        if streamed:
+            print()
+        # Cached, fallback (OpenAI/rule-based) or interrupted-stream summaries were not streamed
+        if "".join(streamed).strip() != summary:
+            print(summary)
+    else:
+        print(summary)
 
     # Instead of grouping by domain, show all papers sequentially sorted by
     # citation count (most cited first). Domain classification is disabled, so
@@ -1542,46 +2553,62 @@ def main():
     print(f"📚 PAPERS ({len(papers)} total) — sorted by citations (high → low)")
     print("=" * 80)
 
-    # Sort all papers by citation count (descending)
-    all_sorted = sorted(papers, key=lambda x: x.get("cited_by_count", 0), reverse=True)
-    #print(all_sorted)
+    # Papers were sorted by citation count (descending) after enrichment
+    all_sorted = papers
     # Paginate output: show 10 papers at a time
     page_size = 10
     total = len(all_sorted)
+    # Summaries for the next page are generated in the background while the
+    # current page is printed and the user reads it. A running prefetch can't
+    # be cancelled through its future, so quitting sets stop_prefetch and the
+    # papers it has not sent to the LLM yet are skipped.
+    prefetcher = ThreadPoolExecutor(max_workers=1)
+    stop_prefetch = threading.Event()
+    next_summaries = prefetcher.submit(summarize_papers, all_sorted[:page_size], 800, cancel=stop_prefetch)
     for start in range(0, total, page_size):
         chunk = all_sorted[start:start + page_size]
-        for offset, p in enumerate(chunk, start + 1):
+        # Each page is summarized concurrently (see summarize_papers)
+        chunk_summaries = next_summaries.result()
+        if start + page_size < total:
+            next_summaries = prefetcher.submit(summarize_papers, all_sorted[start + page_size:start + 2 * page_size], 800,
+                                               cancel=stop_prefetch)
+        # Build the whole page and write it once instead of a print per line
+        lines = []
+        for offset, (p, paper_summary) in enumerate(zip(chunk, chunk_summaries), start + 1):
             # Robust title fallback: avoid printing 'None'
             title = p.get('title') or p.get('display_name') or 'Untitled'
-            print(f"\n{offset}. {title}")
-            print(f"   📅 Year: {p.get('year', 'N/A')} | 📊 Citations: {p.get('cited_by_count', 0)}")
-            print(f"   🏛️  Venue: {p.get('venue', 'N/A')}")
+            lines.append(f"\n{offset}. {title}")
+            lines.append(f"   📅 Year: {p.get('year', 'N/A')} | 📊 Citations: {p.get('cited_by_count', 0)}")
+            lines.append(f"   🏛️  Venue: {p.get('venue', 'N/A')}")
 
             # Show content source
-            if p.get("content_source"):
-                print(f"   📄 Content Source: {p['content_source']}")
+            content_source = p.get("content_source")
+            if content_source:
+                lines.append(f"   📄 Content Source: {content_source}")
 
             # Show co-authors with affiliations (top 5)
-            if p.get("coauthors"):
-                print(f"   👥 Co-authors ({len(p['coauthors'])} total):")
-                for cidx, ca in enumerate(p["coauthors"][:5], 1):
+            coauthors = p.get("coauthors")
+            if coauthors:
+                lines.append(f"   👥 Co-authors ({len(coauthors)} total):")
+                for cidx, ca in enumerate(coauthors[:5], 1):
                     name = ca.get("name", "Unknown")
                     affiliations = ca.get("affiliations", ["Unknown"])
                     affil_str = ", ".join(affiliations[:2])
-                    print(f"      {cidx}. {name} ({affil_str})")
-                if len(p["coauthors"]) > 5:
-                    print(f"      ... and {len(p['coauthors']) - 5} more co-authors")
-
-            if p.get("arxiv_id"):
-                print(f"   📄 arXiv: {p['arxiv_id']}")
-            if p.get("doi"):
-                print(f"   🔗 DOI: {p['doi']}")
-
-            # Generate and show paper summary (use larger token budget)
-            print(f"   📝 Summary:")
-            paper_summary = generate_paper_summary(p, max_tokens=800)
-            for line in paper_summary.split('\n'):
-                print(f"      {line}")
+                    lines.append(f"      {cidx}. {name} ({affil_str})")
+                if len(coauthors) > 5:
+                    lines.append(f"      ... and {len(coauthors) - 5} more co-authors")
+
+            arxiv_id = p.get("arxiv_id")
+            if arxiv_id:
+                lines.append(f"   📄 arXiv: {arxiv_id}")
+            doi = p.get("doi")
+            if doi:
+                lines.append(f"   🔗 DOI: {doi}")
+
+            # Show paper summary (generated above with larger token budget)
+            lines.append(f"   📝 Summary:")
+            lines.extend(f"      {line}" for line in paper_summary.split('\n'))
+        print("\n".join(lines), flush=True)
 
         # Pagination prompt (unless this was the last page)
         if start + page_size < total:
@@ -1594,9 +2621,71 @@ def main():
                 # Non-interactive environment: continue automatically
                 pass
 
+    stop_prefetch.set()
+    prefetcher.shutdown(wait=False, cancel_futures=True)
+
     print("\n" + "=" * 80)
     print("✅ Analysis Complete!")
     print("=" * 80)
 
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    if args.batch_file:
+        args.no_prompt = True
+
+    groq_key = get_groq_api_key_interactive(prompt=not args.no_prompt)
+    if groq_key:
+        if DEBUG:
+            # For security, it's better to print a masked version of the key
+            masked_key = f"{groq_key[:4]}...{groq_key[-4:]}"
+            print(f"✅ DEBUG: GROQ API Key was found and loaded. Key: {masked_key}")
+            # If you absolutely MUST see the full key, uncomment the line below
+            # print(f"!!! INSECURE DEBUG: Full key is: {groq_key} !!!")
+            print("--- [END DEBUGGING] ---\n")
+    else:
+        print("❌ GROQ API Key was NOT found.\n")
+    # Warm the Groq connection while the user picks an author
+    threading.Thread(target=warm_groq_session, daemon=True).start()
+    print("🔍 Enhanced Author Profile System with Multiple Data Sources and Deduplication")
+    print("Data sources: OpenAlex, arXiv, Semantic Scholar, Unpaywall, Crossref")
+    print("Features: Automatic duplicate removal from multiple sources")
+    print("Note: For PDF extraction, install: pip install PyPDF2 pdfplumber")
+    print()
+
+    # Safe input helper to allow non-interactive runs (returns default on EOF
+    # or when prompting is disabled)
+    def safe_input(prompt: str, default: str = "") -> str:
+        if args.no_prompt:
+            return default
+        try:
+            return input(prompt)
+        except EOFError:
+            return default
+
+    if args.batch_file:
+        run_batch(args, safe_input)
+        return
+
+    author_info, candidates = select_author(args, safe_input)
+    if not author_info:
+        return
+
+    profile_ids = merged_profile_ids(author_info, candidates)
+
+    # Step 3: Decide how many papers to fetch
+    max_papers = choose_max_papers(author_info, args, safe_input)
+
+    # Step 4: Fetch and enrich with full content from multiple sources; one
+    # event loop and one HTTP session cover OpenAlex and every enrichment source
+    papers = asyncio.run(fetch_and_enrich_papers(profile_ids, max_papers=max_papers))
+    if not papers:
+        print("❌ No papers found for this author")
+        return
+    if len(profile_ids) > 1:
+        print(f"✅ Merged total of {len(papers)} unique papers from {len(profile_ids)} profiles.")
+
+    report_author(author_info, papers, safe_input)
+
 if __name__ == "__main__":
     main()
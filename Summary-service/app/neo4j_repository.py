@@ -1,7 +1,11 @@
-import json
+import asyncio
+import orjson
 import logging
-from neo4j import AsyncDriver
-from typing import Dict, Any
+import os
+from neo4j import AsyncDriver, RoutingControl, WRITE_ACCESS
+from neo4j.exceptions import Neo4jError
+from collections import OrderedDict
+from typing import Dict, Any, List, Tuple
 import time
 
 # -------------------------
@@ -12,9 +16,50 @@ import time
 STALE_DAYS = 15
 STALE_MS = STALE_DAYS * 24 * 60 * 60 * 1000  # 15 days in milliseconds
 
+# Target database for every session; naming it explicitly skips the driver's
+# home-database lookup on each session open.
+NEO4J_DATABASE = os.environ.get("NEO4J_DATABASE", "neo4j")
+
+# Characters of enriched paper content cached on :Work nodes. The author
+# prompt reads only ~2000 per paper, but the rule-based fallback tallies
+# keywords over the text and the LLM gate (AUTHOR_SUMMARY_MIN_CONTENT_CHARS)
+# sums its length, so keep enough for those to match a fresh enrichment
+# without storing (and re-reading over Bolt) whole PDFs. 0 disables the cap.
+PAPER_CONTENT_CACHE_CHARS = int(os.environ.get("PAPER_CONTENT_CACHE_CHARS", "50000"))
+
+# In-process LRU in front of the cache reads, so a hot author or paper
+# skips the Neo4j round-trip. Entries keep their Neo4j timestamp and expire
+# on the same 15-day schedule; saves from this process refresh them.
+LOCAL_CACHE_SIZE = int(os.environ.get("NEO4J_LOCAL_CACHE_SIZE", "2048"))
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_author_cache: "OrderedDict[str, Tuple[int | None, Dict[str, Any]]]" = OrderedDict()
+_paper_cache: "OrderedDict[str, Tuple[int | None, Dict[str, Any]]]" = OrderedDict()
+# Neo4j paper reads in flight, keyed by ID: concurrent misses for the same
+# paper share one query and one orjson decode
+_inflight_paper_reads: Dict[str, asyncio.Future] = {}
+
+
+def _local_get(cache: OrderedDict, key: str) -> Dict[str, Any] | None:
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    last_updated, value = entry
+    if is_stale(last_updated):
+        del cache[key]
+        return None
+    cache.move_to_end(key)
+    return value
+
+
+def _local_put(cache: OrderedDict, key: str, last_updated: int | None, value: Dict[str, Any]):
+    cache[key] = (last_updated, value)
+    cache.move_to_end(key)
+    while len(cache) > LOCAL_CACHE_SIZE:
+        cache.popitem(last=False)
+
 
 # -------------------------
 # STALENESS CHECK
@@ -34,6 +79,62 @@ def is_stale(last_updated_ts: int | None, max_age_ms: int = STALE_MS) -> bool:
     return age > max_age_ms
 
 
+def fresh_since_ms(max_age_ms: int = STALE_MS) -> int:
+    """
+    Oldest timestamp() value that still counts as fresh; passed to the cache
+    queries as $min_ts so Neo4j drops stale rows before returning them.
+    A missing timestamp coalesces to 0 and is treated as stale, like is_stale().
+    """
+    return int(time.time() * 1000) - max_age_ms
+
+
+
+# -------------------------------------------------------
+# SCHEMA: INDEXES FOR CACHE LOOKUPS
+# -------------------------------------------------------
+
+async def ensure_indexes(driver: AsyncDriver):
+    """
+    Creates the uniqueness constraints backing the cache lookups and MERGEs
+    below. Without them every `{id: $...}` match is a full label scan; the
+    constraint's index also gives MERGE an index seek, and keeps concurrent
+    MERGEs of the same ID from creating duplicate nodes.
+    If existing duplicate IDs block a constraint, a plain index is kept instead.
+    """
+    schema = (
+        ("Author", "author_id"),
+        ("Work", "work_id"),
+    )
+
+    async def run(session, statement: str):
+        await (await session.run(statement)).consume()
+
+    async with driver.session(database=NEO4J_DATABASE, default_access_mode=WRITE_ACCESS) as session:
+        for label, index_name in schema:
+            create_constraint = (
+                f"CREATE CONSTRAINT {index_name}_unique IF NOT EXISTS "
+                f"FOR (n:{label}) REQUIRE n.id IS UNIQUE"
+            )
+            try:
+                await run(session, create_constraint)
+                continue
+            except Neo4jError as e:
+                error = e
+            try:
+                # The plain index earlier versions created blocks an equivalent
+                # constraint; replace it. Duplicate IDs are reported differently
+                # and leave the index in place.
+                if "already exists" in str(error).lower():
+                    await run(session, f"DROP INDEX {index_name} IF EXISTS")
+                    await run(session, create_constraint)
+                    continue
+            except Neo4jError as e:
+                error = e
+            logger.warning(f"Could not create unique constraint on :{label}(id) ({error}); using a plain index")
+            await run(session, f"CREATE INDEX {index_name} IF NOT EXISTS FOR (n:{label}) ON (n.id)")
+
+    logger.info("Ensured Neo4j constraints/indexes on :Author(id) and :Work(id)")
+
 
 # -------------------------------------------------------
 # AUTHOR CACHING WITH 15-DAY STALENESS CHECK
@@ -46,7 +147,7 @@ async def get_author_summary_from_neo4j(driver: AsyncDriver, author_id: str) ->
     """
     query = (
         "MATCH (a:Author {id: $author_id}) "
-        "WHERE a.researchSummary IS NOT NULL "
+        "WHERE a.researchSummary IS NOT NULL AND coalesce(a.lastUpdated, 0) > $min_ts "
         "RETURN "
         "    a.researchSummary AS summary, "
         "    a.papersAnalyzedCount AS count, "
@@ -54,30 +155,86 @@ async def get_author_summary_from_neo4j(driver: AsyncDriver, author_id: str) ->
         "    a.lastUpdated AS last_updated"
     )
 
+    cached = _local_get(_author_cache, author_id)
+    if cached is not None:
+        logger.info(f"Local cache hit for author ID: {author_id}")
+        return cached
+
     logger.info(f"Checking Neo4j author cache for ID: {author_id}")
 
-    async with driver.session() as session:
-        result = await session.run(query, author_id=author_id)
-        record = await result.single()
+    records, _, _ = await driver.execute_query(
+        query,
+        author_id=author_id,
+        min_ts=fresh_since_ms(),
+        database_=NEO4J_DATABASE,
+        routing_=RoutingControl.READ,
+    )
+    record = records[0] if records else None
+
+    if not record or not record["summary"]:
+        logger.info(f"Cache miss (or stale entry) for author ID: {author_id}")
+        return None
+
+    last_updated = record.get("last_updated")
+
+    logger.info(f"Fresh cache hit for author ID: {author_id}")
+
+    papers_sample = orjson.loads(record["sample_json"]) if record["sample_json"] else []
 
-        if not record or not record["summary"]:
-            logger.info(f"Cache miss for author ID: {author_id}")
-            return None
-        
-        last_updated = record.get("last_updated")
-        if is_stale(last_updated):
-            logger.info(f"Stale author cache (or missing timestamp) for ID {author_id}. Re-ingesting.")
-            return None
+    payload = {
+        "research_summary": record["summary"],
+        "papers_analyzed_count": record["count"],
+        "papers_sample": papers_sample,
+    }
+    _local_put(_author_cache, author_id, last_updated, payload)
+    return payload
 
-        logger.info(f"Fresh cache hit for author ID: {author_id}")
 
-        papers_sample = json.loads(record["sample_json"]) if record["sample_json"] else []
+async def get_author_summaries_batch(driver: AsyncDriver, author_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetches fresh cached author summaries for many authors in one round-trip.
+    Returns {author_id: payload} (same payload as get_author_summary_from_neo4j)
+    for the IDs that have a non-stale summary.
+    """
+    summaries = {}
+    for author_id in author_ids:
+        cached = _local_get(_author_cache, author_id)
+        if cached is not None:
+            summaries[author_id] = cached
+    missing = [author_id for author_id in author_ids if author_id not in summaries]
+    if not missing:
+        return summaries
+
+    query = (
+        "UNWIND $author_ids AS author_id "
+        "MATCH (a:Author {id: author_id}) "
+        "WHERE a.researchSummary IS NOT NULL AND coalesce(a.lastUpdated, 0) > $min_ts "
+        "RETURN "
+        "    author_id, "
+        "    a.researchSummary AS summary, "
+        "    a.papersAnalyzedCount AS count, "
+        "    a.papersSampleJson AS sample_json, "
+        "    a.lastUpdated AS last_updated"
+    )
+
+    records, _, _ = await driver.execute_query(
+        query,
+        author_ids=missing,
+        min_ts=fresh_since_ms(),
+        database_=NEO4J_DATABASE,
+        routing_=RoutingControl.READ,
+    )
 
-        return {
+    for record in records:
+        payload = {
             "research_summary": record["summary"],
             "papers_analyzed_count": record["count"],
-            "papers_sample": papers_sample,
+            "papers_sample": orjson.loads(record["sample_json"]) if record["sample_json"] else [],
         }
+        _local_put(_author_cache, record["author_id"], record["last_updated"], payload)
+        summaries[record["author_id"]] = payload
+    logger.info(f"Batch author cache: {len(summaries)}/{len(author_ids)} fresh hits")
+    return summaries
 
 
 async def save_author_summary_to_neo4j(driver: AsyncDriver, author_info: Dict[str, Any], summary_data: Dict[str, Any]):
@@ -91,7 +248,7 @@ async def save_author_summary_to_neo4j(driver: AsyncDriver, author_info: Dict[st
         logger.error("Missing author ID or display name; cannot save.")
         return
 
-    papers_sample_json = json.dumps(summary_data.get("papers_sample", []))
+    papers_sample_json = orjson.dumps(summary_data.get("papers_sample", [])).decode()
 
     query = (
         "MERGE (a:Author {id: $author_id}) "
@@ -106,15 +263,21 @@ async def save_author_summary_to_neo4j(driver: AsyncDriver, author_info: Dict[st
     logger.info(f"Saving author summary for {display_name} ({author_id})")
 
     try:
-        async with driver.session() as session:
-            await session.run(
-                query,
-                author_id=author_id,
-                display_name=display_name,
-                summary=summary_data.get("research_summary"),
-                count=summary_data.get("papers_analyzed_count"),
-                sample_json=papers_sample_json,
-            )
+        await driver.execute_query(
+            query,
+            author_id=author_id,
+            display_name=display_name,
+            summary=summary_data.get("research_summary"),
+            count=summary_data.get("papers_analyzed_count"),
+            sample_json=papers_sample_json,
+            database_=NEO4J_DATABASE,
+            routing_=RoutingControl.WRITE,
+        )
+        _local_put(_author_cache, author_id, int(time.time() * 1000), {
+            "research_summary": summary_data.get("research_summary"),
+            "papers_analyzed_count": summary_data.get("papers_analyzed_count"),
+            "papers_sample": summary_data.get("papers_sample", []),
+        })
         logger.info(f"Successfully saved author summary: {display_name}")
     except Exception as e:
         logger.error(f"Failed to save author summary for {display_name}: {e}")
@@ -130,9 +293,25 @@ async def get_paper_cache_from_neo4j(driver: AsyncDriver, paper_id: str) -> Dict
     Fetches cached paper info + summary + timestamp.
     Includes staleness validation (15 days).
     """
+    cached = _local_get(_paper_cache, paper_id)
+    if cached is not None:
+        logger.info(f"Local cache hit for paper ID: {paper_id}")
+        return cached
+
+    pending = _inflight_paper_reads.get(paper_id)
+    if pending is None:
+        pending = asyncio.ensure_future(_read_paper_cache(driver, paper_id))
+        _inflight_paper_reads[paper_id] = pending
+        pending.add_done_callback(lambda _: _inflight_paper_reads.pop(paper_id, None))
+    # shield() so one cancelled caller cannot cancel the shared read
+    return await asyncio.shield(pending)
+
+
+async def _read_paper_cache(driver: AsyncDriver, paper_id: str) -> Dict[str, Any] | None:
     query = (
         "MATCH (w:Work {id: $paper_id}) "
         "WHERE w.summary IS NOT NULL AND w.infoJson IS NOT NULL "
+        "  AND coalesce(w.summaryLastUpdated, 0) > $min_ts "
         "RETURN "
         "    w.summary AS summary, "
         "    w.infoJson AS info_json, "
@@ -141,25 +320,86 @@ async def get_paper_cache_from_neo4j(driver: AsyncDriver, paper_id: str) -> Dict
 
     logger.info(f"Checking Neo4j paper cache for ID: {paper_id}")
 
-    async with driver.session() as session:
-        result = await session.run(query, paper_id=paper_id)
-        record = await result.single()
+    records, _, _ = await driver.execute_query(
+        query,
+        paper_id=paper_id,
+        min_ts=fresh_since_ms(),
+        database_=NEO4J_DATABASE,
+        routing_=RoutingControl.READ,
+    )
+    record = records[0] if records else None
+
+    if not record or not record["summary"] or not record["info_json"]:
+        logger.info(f"Cache miss (or stale entry) for paper ID: {paper_id}")
+        return None
+
+    last_updated = record.get("last_updated")
+
+    logger.info(f"Fresh cache hit for paper ID: {paper_id}")
+
+    payload = {
+        "summary": record["summary"],
+        "paper_info": orjson.loads(record["info_json"]),
+    }
+    _local_put(_paper_cache, paper_id, last_updated, payload)
+    return payload
+
 
-        if not record or not record["summary"] or not record["info_json"]:
-            logger.info(f"Cache miss for paper ID: {paper_id}")
-            return None
+def _content_sources(sources_json: str | None, info_json: str | None) -> List[str]:
+    """Source labels of a cached paper; entries saved before contentSourcesJson
+    existed fall back to the enrichment labels inside infoJson."""
+    if sources_json:
+        return orjson.loads(sources_json)
+    if info_json:
+        return orjson.loads(info_json).get("content_sources") or []
+    return []
 
-        last_updated = record.get("last_updated")
-        if is_stale(last_updated):
-            logger.info(f"Stale paper cache (or missing timestamp) for ID {paper_id}. Re-ingesting.")
-            return None
 
-        logger.info(f"Fresh cache hit for paper ID: {paper_id}")
+async def get_paper_summaries_batch(driver: AsyncDriver, paper_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetches fresh cached summaries for many papers in one round-trip.
+    Returns {paper_id: {"summary": ..., "content_sources": [...]}} for the IDs
+    that have a non-stale summary; content_sources are the labels of the
+    sources the summary was generated from.
+    """
+    summaries = {}
+    for paper_id in paper_ids:
+        cached = _local_get(_paper_cache, paper_id)
+        if cached is not None:
+            summaries[paper_id] = {
+                "summary": cached["summary"],
+                "content_sources": cached["paper_info"].get("content_sources") or [],
+            }
+    missing = [paper_id for paper_id in paper_ids if paper_id not in summaries]
+    if not missing:
+        return summaries
+
+    query = (
+        "UNWIND $paper_ids AS paper_id "
+        "MATCH (w:Work {id: paper_id}) "
+        "WHERE w.summary IS NOT NULL AND coalesce(w.summaryLastUpdated, 0) > $min_ts "
+        "RETURN "
+        "    paper_id, "
+        "    w.summary AS summary, "
+        "    w.contentSourcesJson AS sources_json, "
+        "    CASE WHEN w.contentSourcesJson IS NULL THEN w.infoJson END AS info_json"
+    )
+
+    records, _, _ = await driver.execute_query(
+        query,
+        paper_ids=missing,
+        min_ts=fresh_since_ms(),
+        database_=NEO4J_DATABASE,
+        routing_=RoutingControl.READ,
+    )
 
-        return {
+    for record in records:
+        summaries[record["paper_id"]] = {
             "summary": record["summary"],
-            "paper_info": json.loads(record["info_json"]),
+            "content_sources": _content_sources(record["sources_json"], record["info_json"]),
         }
+    logger.info(f"Batch paper cache: {len(summaries)}/{len(paper_ids)} fresh hits")
+    return summaries
 
 
 async def save_paper_cache_to_neo4j(driver: AsyncDriver, paper_info: Dict[str, Any], summary: str):
@@ -173,7 +413,8 @@ async def save_paper_cache_to_neo4j(driver: AsyncDriver, paper_info: Dict[str, A
         logger.error("Paper ID or title is missing; cannot save.")
         return
 
-    info_json = json.dumps(paper_info)
+    info_json = orjson.dumps(paper_info).decode()
+    sources_json = orjson.dumps(paper_info.get("content_sources") or []).decode()
 
     query = (
         "MERGE (w:Work {id: $paper_id}) "
@@ -181,20 +422,109 @@ async def save_paper_cache_to_neo4j(driver: AsyncDriver, paper_info: Dict[str, A
         "SET "
         "    w.summary = $summary, "
         "    w.infoJson = $info_json, "
+        "    w.contentSourcesJson = $sources_json, "
         "    w.summaryLastUpdated = timestamp()"
     )
 
     logger.info(f"Saving paper cache for ID {paper_id}: {title}")
 
     try:
-        async with driver.session() as session:
-            await session.run(
-                query,
-                paper_id=paper_id,
-                title=title,
-                summary=summary,
-                info_json=info_json,
-            )
+        await driver.execute_query(
+            query,
+            paper_id=paper_id,
+            title=title,
+            summary=summary,
+            info_json=info_json,
+            sources_json=sources_json,
+            database_=NEO4J_DATABASE,
+            routing_=RoutingControl.WRITE,
+        )
+        _local_put(_paper_cache, paper_id, int(time.time() * 1000), {
+            "summary": summary,
+            "paper_info": paper_info,
+        })
         logger.info(f"Successfully saved paper cache for: {title}")
     except Exception as e:
         logger.error(f"Failed to save paper cache for {title}: {e}")
+
+
+# -------------------------------------------------------
+# ENRICHED PAPER CONTENT (AUTHOR SUMMARY INPUT)
+# -------------------------------------------------------
+
+async def get_paper_contents_batch(driver: AsyncDriver, paper_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetches fresh enriched content for many papers in one round-trip.
+    Returns {paper_id: {"full_content": ..., "content_sources": [...]}}
+    for the IDs whose content is non-stale.
+    """
+    if not paper_ids:
+        return {}
+
+    query = (
+        "UNWIND $paper_ids AS paper_id "
+        "MATCH (w:Work {id: paper_id}) "
+        "WHERE w.fullContent IS NOT NULL AND coalesce(w.contentLastUpdated, 0) > $min_ts "
+        "RETURN "
+        "    paper_id, "
+        "    w.fullContent AS full_content, "
+        "    w.contentSourcesJson AS sources_json"
+    )
+
+    records, _, _ = await driver.execute_query(
+        query,
+        paper_ids=paper_ids,
+        min_ts=fresh_since_ms(),
+        database_=NEO4J_DATABASE,
+        routing_=RoutingControl.READ,
+    )
+
+    contents = {
+        record["paper_id"]: {
+            "full_content": record["full_content"],
+            "content_sources": orjson.loads(record["sources_json"]) if record["sources_json"] else [],
+        }
+        for record in records
+    }
+    logger.info(f"Batch paper content cache: {len(contents)}/{len(paper_ids)} fresh hits")
+    return contents
+
+
+async def save_paper_contents_batch(driver: AsyncDriver, papers: List[Dict[str, Any]]):
+    """
+    Saves the enriched content of many papers in one write, with timestamp.
+    Papers without an ID or without any content are skipped.
+    """
+    rows = [
+        {
+            "paper_id": p["openalex_id"],
+            "title": p.get("title"),
+            "full_content": p["full_content"][:PAPER_CONTENT_CACHE_CHARS or None],
+            "sources_json": orjson.dumps(p.get("content_sources") or []).decode(),
+        }
+        for p in papers
+        if p.get("openalex_id") and p.get("full_content")
+    ]
+    if not rows:
+        return
+
+    query = (
+        "UNWIND $rows AS row "
+        "MERGE (w:Work {id: row.paper_id}) "
+        "ON CREATE SET w.title = row.title "
+        "SET "
+        "    w.fullContent = row.full_content, "
+        "    w.contentSourcesJson = row.sources_json, "
+        "    w.contentLastUpdated = timestamp()"
+    )
+
+    try:
+        await driver.execute_query(
+            query,
+            rows=rows,
+            database_=NEO4J_DATABASE,
+            routing_=RoutingControl.WRITE,
+        )
+        logger.info(f"Saved enriched content for {len(rows)} papers")
+    except Exception as e:
+        logger.error(f"Failed to save enriched content for {len(rows)} papers: {e}")